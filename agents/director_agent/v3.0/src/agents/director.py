@@ -1,9 +1,17 @@
 """
 Director Agent for managing presentation creation workflow.
 """
-import os
-import json
+import asyncio
+import logging
+import hashlib
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Union, Dict, Any
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is listed in requirements
+    tiktoken = None
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.exceptions import ModelHTTPError
@@ -26,14 +34,61 @@ from src.utils.deck_builder_client import DeckBuilderClient
 from orchestration import ContentOrchestrator
 from orchestration.clients.real_text_client import RealTextClient
 from orchestration.clients.real_chart_client import RealChartClient
-from orchestration.clients.real_image_client import RealImageClient
-from orchestration.clients.real_diagram_client import RealDiagramClient
+from orchestration.clients.real_image_client import get_image_client
+from orchestration.clients.real_diagram_client import get_diagram_client
+from orchestration.clients.http_session import create_shared_session, close_shared_aiohttp_session
 from src.utils.orchestrator_transformer import (
     OrchestratorTransformer, EnrichedPresentationResponse
 )
 
 logger = setup_logger(__name__)
 
+# States whose responses are reused verbatim for an identical user prompt
+RESPONSE_CACHE_STATES = frozenset({
+    "PROVIDE_GREETING", "ASK_CLARIFYING_QUESTIONS", "CREATE_CONFIRMATION_PLAN"
+})
+RESPONSE_CACHE_MAX_ENTRIES = 10_000
+
+# Modular prompts live in the agent's config directory
+_PROMPT_DIR = Path(__file__).resolve().parents[2] / 'config' / 'prompts' / 'modular'
+
+# State → state-specific prompt file (combined with base_prompt.md)
+_STATE_PROMPT_MAP = {
+    'PROVIDE_GREETING': 'provide_greeting.md',
+    'ASK_CLARIFYING_QUESTIONS': 'ask_clarifying_questions.md',
+    'CREATE_CONFIRMATION_PLAN': 'create_confirmation_plan.md',
+    'GENERATE_STRAWMAN': 'generate_strawman.md',
+    'REFINE_STRAWMAN': 'refine_strawman.md',
+    'CONTENT_GENERATION': 'generate_content.md'
+}
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the cl100k_base encoding once; None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, using len/4 estimate: {e}")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Count tokens with tiktoken, falling back to the len/4 estimate."""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=None)
+def _get_base_prompt() -> str:
+    """Read the shared base prompt once per process."""
+    return (_PROMPT_DIR / 'base_prompt.md').read_text()
+
 
 class DirectorAgent:
     """Main agent for handling presentation creation states."""
@@ -49,6 +104,8 @@ class DirectorAgent:
 
         # Determine which model to use
         if settings.GOOGLE_API_KEY:
+            # One provider owns one google-genai client (and its connection pool);
+            # both models below reuse it, so flash/pro calls share connections
             provider = GoogleProvider(api_key=settings.GOOGLE_API_KEY)
             # Use GoogleModel with explicit settings for better control
             model = GoogleModel('gemini-2.5-flash', provider=provider)
@@ -65,108 +122,211 @@ class DirectorAgent:
                 "ANTHROPIC_API_KEY in your .env file."
             )
 
+        # Provider-native prompt caching for the static system prompts.
+        # Gemini 2.5 and OpenAI cache repeated prompt prefixes automatically;
+        # Anthropic needs the system block marked with cache_control.
+        self.prompt_cache_settings: Dict[str, Any] = {}
+        if not settings.GOOGLE_API_KEY and not settings.OPENAI_API_KEY:
+            self.prompt_cache_settings = {"anthropic_cache_instructions": True}
+
+        # Per-state run settings are constants; build them once
+        self._settings: Dict[str, ModelSettings] = {
+            "PROVIDE_GREETING": self._model_settings(0.7, 500),
+            "ASK_CLARIFYING_QUESTIONS": self._model_settings(0.5, 1000),
+            "CREATE_CONFIRMATION_PLAN": self._model_settings(0.3, 2000),
+            "GENERATE_STRAWMAN": self._model_settings(0.4, 8000),
+            "REFINE_STRAWMAN": self._model_settings(0.4, 8000),
+            "CONTENT_GENERATION": self._model_settings(0.7, 800),
+        }
+        self._orchestrator_disabled_settings = self._model_settings(0.7, 500)
+
         # Initialize agents with embedded modular prompts
         logger.info("DirectorAgent initializing with embedded modular prompts")
         self._init_agents_with_embedded_prompts(model, model_turbo)
 
+        # State → handler dispatch table; every handler takes (state_context, user_prompt)
+        self._state_handlers = {
+            "PROVIDE_GREETING": self._handle_greeting,
+            "ASK_CLARIFYING_QUESTIONS": self._handle_questions,
+            "CREATE_CONFIRMATION_PLAN": self._handle_plan,
+            "GENERATE_STRAWMAN": self._handle_generate_strawman,
+            "REFINE_STRAWMAN": self._handle_refine_strawman,
+            "CONTENT_GENERATION": self.process_content_generation,
+        }
+
         # Initialize context builder and token tracker
         self.context_builder = ContextBuilder()
         self.token_tracker = TokenTracker()
 
-        # v2.0: Initialize deck-builder components
-        self.deck_builder_enabled = getattr(settings, 'DECK_BUILDER_ENABLED', True)
-        if self.deck_builder_enabled:
-            try:
-                self.layout_mapper = LayoutMapper()
-                self.content_transformer = ContentTransformer(self.layout_mapper)
-                deck_builder_url = getattr(settings, 'DECK_BUILDER_API_URL', 'http://localhost:8000')
-                self.deck_builder_client = DeckBuilderClient(deck_builder_url)
-                logger.info(f"Deck-builder integration enabled: {deck_builder_url}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize deck-builder components: {e}")
-                logger.warning("Deck-builder integration disabled, will return JSON only")
-                self.deck_builder_enabled = False
-        else:
+        # Pooled HTTP session shared by the orchestrator's service clients (lazy)
+        self._http_session = None
+
+        # Fire-and-forget bookkeeping tasks (held so they aren't GC'd mid-flight)
+        self._background_tasks: set = set()
+
+        # LRU response cache for the templated early states: key -> serialized output
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+
+        # v2.0: Deck-builder components are built lazily on first strawman
+        self.deck_builder_enabled = settings.DECK_BUILDER_ENABLED
+        self.deck_builder_url = settings.DECK_BUILDER_API_URL
+        if not self.deck_builder_enabled:
             logger.info("Deck-builder integration disabled in settings")
 
-        # v3.0: Initialize Content Orchestrator components (internal module)
-        self.content_orchestrator_enabled = getattr(settings, 'CONTENT_ORCHESTRATOR_ENABLED', True)
-        if self.content_orchestrator_enabled:
-            try:
-                # Initialize service clients
-                text_client = RealTextClient()
-                chart_client = RealChartClient()
-                image_client = RealImageClient()
-                diagram_client = RealDiagramClient()
-
-                # Initialize internal orchestrator
-                self.content_orchestrator = ContentOrchestrator(
-                    text_client=text_client,
-                    chart_client=chart_client,
-                    image_client=image_client,
-                    diagram_client=diagram_client
-                )
-                self.orchestrator_transformer = OrchestratorTransformer()
-                logger.info("Content Orchestrator integration enabled (internal module)")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Content Orchestrator components: {e}")
-                logger.warning("Content Orchestrator integration disabled, will use placeholder content")
-                self.content_orchestrator_enabled = False
-        else:
+        # v3.0: Content Orchestrator components are built lazily on first use
+        self.content_orchestrator_enabled = settings.CONTENT_ORCHESTRATOR_ENABLED
+        if not self.content_orchestrator_enabled:
             logger.info("Content Orchestrator integration disabled in settings")
 
         logger.info(f"DirectorAgent initialized with {type(model).__name__ if hasattr(model, '__class__') else model} model")
 
-    def _load_modular_prompt(self, state: str) -> str:
-        """Load and combine base prompt with state-specific prompt."""
-        # Get the base path - this now points to the agent's config directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        prompt_dir = os.path.join(base_dir, 'config', 'prompts', 'modular')
+    @cached_property
+    def layout_mapper(self) -> LayoutMapper:
+        """Layout mapper for deck-builder transforms (built on first use)."""
+        return LayoutMapper()
+
+    @cached_property
+    def content_transformer(self) -> ContentTransformer:
+        """Strawman → deck-builder payload transformer (built on first use)."""
+        return ContentTransformer(self.layout_mapper)
+
+    @cached_property
+    def deck_builder_client(self) -> DeckBuilderClient:
+        """Deck-builder API client (built on first use)."""
+        client = DeckBuilderClient(self.deck_builder_url)
+        logger.info(f"Deck-builder integration enabled: {self.deck_builder_url}")
+        return client
+
+    @cached_property
+    def content_orchestrator(self) -> ContentOrchestrator:
+        """Internal Content Orchestrator with its service clients (built on first use)."""
+        # Initialize service clients; the text client uses a pooled requests
+        # session, the chart/image/diagram clients the shared aiohttp session;
+        # image/diagram clients are process-wide so their caches persist
+        self._http_session = create_shared_session()
+        text_client = RealTextClient(session=self._http_session)
+        chart_client = RealChartClient()
+        image_client = get_image_client()
+        diagram_client = get_diagram_client()
+
+        # Initialize internal orchestrator
+        orchestrator = ContentOrchestrator(
+            text_client=text_client,
+            chart_client=chart_client,
+            image_client=image_client,
+            diagram_client=diagram_client
+        )
+        logger.info("Content Orchestrator integration enabled (internal module)")
+        return orchestrator
+
+    @cached_property
+    def orchestrator_transformer(self) -> OrchestratorTransformer:
+        """Transformer for orchestrator responses (built on first use)."""
+        return OrchestratorTransformer()
+
+    def _deck_builder_available(self) -> bool:
+        """Materialize deck-builder components, disabling the integration on failure."""
+        if not self.deck_builder_enabled:
+            return False
+        try:
+            self.content_transformer
+            self.deck_builder_client
+        except Exception as e:
+            logger.warning(f"Failed to initialize deck-builder components: {e}")
+            logger.warning("Deck-builder integration disabled, will return JSON only")
+            self.deck_builder_enabled = False
+        return self.deck_builder_enabled
+
+    def _content_orchestrator_available(self) -> bool:
+        """Materialize orchestrator components, disabling the integration on failure."""
+        if not self.content_orchestrator_enabled:
+            return False
+        try:
+            self.content_orchestrator
+            self.orchestrator_transformer
+        except Exception as e:
+            logger.warning(f"Failed to initialize Content Orchestrator components: {e}")
+            logger.warning("Content Orchestrator integration disabled, will use placeholder content")
+            self.content_orchestrator_enabled = False
+        return self.content_orchestrator_enabled
+
+    def _model_settings(self, temperature: float, max_tokens: int) -> ModelSettings:
+        """Build run settings, including any provider prompt-caching flags."""
+        return ModelSettings(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **self.prompt_cache_settings
+        )
 
-        # Load base prompt
-        base_path = os.path.join(prompt_dir, 'base_prompt.md')
-        with open(base_path, 'r') as f:
-            base_prompt = f.read()
+    async def _run_cached(self, agent: Agent, output_type: type, state: str,
+                          user_prompt: str, model_settings: ModelSettings):
+        """
+        Run an agent, reusing a cached response for an identical (state, prompt).
 
+        Only states in RESPONSE_CACHE_STATES are cached. Outputs are stored
+        serialized so callers always receive a fresh object.
+        """
+        if state not in RESPONSE_CACHE_STATES:
+            result = await agent.run(user_prompt, model_settings=model_settings)
+            return result.output
+
+        key = self._response_cache_key(state, user_prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logger.info(f"Response cache hit for state {state}")
+            if output_type is str:
+                return cached
+            return output_type.model_validate_json(cached)
+
+        result = await agent.run(user_prompt, model_settings=model_settings)
+        output = result.output
+        self._store_cached_response(
+            key, output if isinstance(output, str) else output.model_dump_json()
+        )
+        return output
+
+    @staticmethod
+    def _response_cache_key(state: str, user_prompt: str) -> str:
+        """Response cache key for an exact (state, user_prompt) pair."""
+        return hashlib.sha256(f"{state}\x00{user_prompt}".encode()).hexdigest()
+
+    def _store_cached_response(self, key: str, serialized: str) -> None:
+        """Insert a serialized response, evicting the least recently used entry."""
+        self._response_cache[key] = serialized
+        if len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_modular_prompt(state: str) -> str:
+        """Load and combine base prompt with state-specific prompt (cached per state)."""
         # Load state-specific prompt
-        state_prompt_map = {
-            'PROVIDE_GREETING': 'provide_greeting.md',
-            'ASK_CLARIFYING_QUESTIONS': 'ask_clarifying_questions.md',
-            'CREATE_CONFIRMATION_PLAN': 'create_confirmation_plan.md',
-            'GENERATE_STRAWMAN': 'generate_strawman.md',
-            'REFINE_STRAWMAN': 'refine_strawman.md',
-            'CONTENT_GENERATION': 'generate_content.md'
-        }
-
-        state_file = state_prompt_map.get(state)
+        state_file = _STATE_PROMPT_MAP.get(state)
         if not state_file:
             raise ValueError(f"Unknown state for prompt loading: {state}")
 
-        state_path = os.path.join(prompt_dir, state_file)
-        with open(state_path, 'r') as f:
-            state_prompt = f.read()
+        state_prompt = (_PROMPT_DIR / state_file).read_text()
 
         # Combine prompts
-        return f"{base_prompt}\n\n{state_prompt}"
+        return f"{_get_base_prompt()}\n\n{state_prompt}"
 
     def _init_agents_with_embedded_prompts(self, model, model_turbo):
         """Initialize agents with embedded modular prompts."""
-        # Load state-specific combined prompts (base + state instructions)
-        greeting_prompt = self._load_modular_prompt("PROVIDE_GREETING")
-        questions_prompt = self._load_modular_prompt("ASK_CLARIFYING_QUESTIONS")
-        plan_prompt = self._load_modular_prompt("CREATE_CONFIRMATION_PLAN")
-        strawman_prompt = self._load_modular_prompt("GENERATE_STRAWMAN")
-        refine_prompt = self._load_modular_prompt("REFINE_STRAWMAN")
-        content_prompt = self._load_modular_prompt("CONTENT_GENERATION")
+        # Load state-specific combined prompts (base + state instructions);
+        # six small local reads, cached per process after the first agent
+        prompts = {state: self._load_modular_prompt(state) for state in _STATE_PROMPT_MAP}
+
+        greeting_prompt = prompts["PROVIDE_GREETING"]
+        questions_prompt = prompts["ASK_CLARIFYING_QUESTIONS"]
+        plan_prompt = prompts["CREATE_CONFIRMATION_PLAN"]
+        strawman_prompt = prompts["GENERATE_STRAWMAN"]
+        refine_prompt = prompts["REFINE_STRAWMAN"]
+        content_prompt = prompts["CONTENT_GENERATION"]
 
         # Store system prompt tokens for each state (for tracking)
         self.state_prompt_tokens = {
-            "PROVIDE_GREETING": len(greeting_prompt) // 4,
-            "ASK_CLARIFYING_QUESTIONS": len(questions_prompt) // 4,
-            "CREATE_CONFIRMATION_PLAN": len(plan_prompt) // 4,
-            "GENERATE_STRAWMAN": len(strawman_prompt) // 4,
-            "REFINE_STRAWMAN": len(refine_prompt) // 4,
-            "CONTENT_GENERATION": len(content_prompt) // 4
+            state: _count_tokens(prompt) for state, prompt in prompts.items()
         }
 
         # Initialize greeting agent
@@ -235,155 +395,13 @@ class DirectorAgent:
             Response appropriate for the current state
         """
         try:
-            session_id = state_context.session_data.get("id", "unknown")
-
-            # Build context for the user prompt (system prompts are already embedded in agents)
-            context, user_prompt = self.context_builder.build_context(
-                state=state_context.current_state,
-                session_data={
-                    "id": session_id,
-                    "user_initial_request": state_context.session_data.get("user_initial_request"),
-                    "clarifying_answers": state_context.session_data.get("clarifying_answers"),
-                    "conversation_history": state_context.conversation_history,
-                    # v3.0: Pass strawman data for content generation
-                    "strawman": state_context.session_data.get("strawman"),
-                    "presentation_strawman": state_context.session_data.get("presentation_strawman")
-                },
-                user_intent=state_context.user_intent.dict() if hasattr(state_context, 'user_intent') and state_context.user_intent else None
-            )
-
-            # Track token usage
-            user_tokens = len(user_prompt) // 4
-            system_tokens = self.state_prompt_tokens.get(state_context.current_state, 0)
+            user_prompt = self._prepare_user_prompt(state_context)
 
-            await self.token_tracker.track_modular(
-                session_id,
-                state_context.current_state,
-                user_tokens,
-                system_tokens
-            )
-
-            logger.info(
-                f"Processing - State: {state_context.current_state}, "
-                f"User Tokens: {user_tokens}, System Tokens: {system_tokens}, "
-                f"Total: {user_tokens + system_tokens}"
-            )
-
-            # Route to appropriate agent based on state
-            if state_context.current_state == "PROVIDE_GREETING":
-                result = await self.greeting_agent.run(
-                    user_prompt,
-                    model_settings=ModelSettings(temperature=0.7, max_tokens=500)
-                )
-                response = result.output  # Simple string
-                logger.info("Generated greeting")
-
-            elif state_context.current_state == "ASK_CLARIFYING_QUESTIONS":
-                result = await self.questions_agent.run(
-                    user_prompt,
-                    model_settings=ModelSettings(temperature=0.5, max_tokens=1000)
-                )
-                response = result.output  # ClarifyingQuestions object
-                logger.info(f"Generated {len(response.questions)} clarifying questions")
-
-            elif state_context.current_state == "CREATE_CONFIRMATION_PLAN":
-                result = await self.plan_agent.run(
-                    user_prompt,
-                    model_settings=ModelSettings(temperature=0.3, max_tokens=2000)
-                )
-                response = result.output  # ConfirmationPlan object
-                logger.info(f"Generated confirmation plan with {response.proposed_slide_count} slides")
-
-            elif state_context.current_state == "GENERATE_STRAWMAN":
-                logger.info("Generating strawman presentation")
-                result = await self.strawman_agent.run(
-                    user_prompt,
-                    model_settings=ModelSettings(temperature=0.4, max_tokens=8000)
-                )
-                strawman = result.output  # PresentationStrawman object
-                logger.info(f"Generated strawman with {len(strawman.slides)} slides")
-                logger.debug(f"First slide: {strawman.slides[0].slide_id if strawman.slides else 'No slides'}")
-
-                # Post-process to ensure asset fields are in correct format
-                strawman = AssetFormatter.format_strawman(strawman)
-                logger.info("Applied asset field formatting to strawman")
-
-                # v2.0: Transform and send to deck-builder API
-                if self.deck_builder_enabled:
-                    try:
-                        logger.info("Transforming presentation for deck-builder")
-                        api_payload = self.content_transformer.transform_presentation(strawman)
-                        logger.debug(f"Transformed to {len(api_payload['slides'])} deck-builder slides")
-
-                        logger.info("Calling deck-builder API")
-                        api_response = await self.deck_builder_client.create_presentation(api_payload)
-                        presentation_url = self.deck_builder_client.get_full_url(api_response['url'])
-
-                        logger.info(f"✅ Presentation created: {presentation_url}")
-
-                        # Return URL response instead of strawman
-                        response = {
-                            "type": "presentation_url",
-                            "url": presentation_url,
-                            "presentation_id": api_response['id'],
-                            "slide_count": len(strawman.slides),
-                            "message": f"Your presentation is ready! View it at: {presentation_url}"
-                        }
-                    except Exception as e:
-                        logger.error(f"Deck-builder API failed: {e}", exc_info=True)
-                        logger.warning("Falling back to JSON response")
-                        response = strawman
-                else:
-                    response = strawman
-
-            elif state_context.current_state == "REFINE_STRAWMAN":
-                logger.info("Refining strawman presentation")
-                result = await self.refine_strawman_agent.run(
-                    user_prompt,
-                    model_settings=ModelSettings(temperature=0.4, max_tokens=8000)
-                )
-                strawman = result.output  # PresentationStrawman object
-                logger.info(f"Refined strawman with {len(strawman.slides)} slides")
-
-                # Post-process to ensure asset fields are in correct format
-                strawman = AssetFormatter.format_strawman(strawman)
-                logger.info("Applied asset field formatting to refined strawman")
-
-                # v2.0: Transform and send to deck-builder API
-                if self.deck_builder_enabled:
-                    try:
-                        logger.info("Transforming refined presentation for deck-builder")
-                        api_payload = self.content_transformer.transform_presentation(strawman)
-                        logger.debug(f"Transformed to {len(api_payload['slides'])} deck-builder slides")
-
-                        logger.info("Calling deck-builder API")
-                        api_response = await self.deck_builder_client.create_presentation(api_payload)
-                        presentation_url = self.deck_builder_client.get_full_url(api_response['url'])
-
-                        logger.info(f"✅ Refined presentation created: {presentation_url}")
-
-                        # Return URL response instead of strawman
-                        response = {
-                            "type": "presentation_url",
-                            "url": presentation_url,
-                            "presentation_id": api_response['id'],
-                            "slide_count": len(strawman.slides),
-                            "message": f"Your refined presentation is ready! View it at: {presentation_url}"
-                        }
-                    except Exception as e:
-                        logger.error(f"Deck-builder API failed: {e}", exc_info=True)
-                        logger.warning("Falling back to JSON response")
-                        response = strawman
-                else:
-                    response = strawman
-
-            elif state_context.current_state == "CONTENT_GENERATION":
-                logger.info("Starting content generation via Content Orchestrator")
-                # Delegate to the content generation method
-                response = await self.process_content_generation(state_context, user_prompt)
-
-            else:
+            # Route to appropriate handler based on state
+            handler = self._state_handlers.get(state_context.current_state)
+            if handler is None:
                 raise ValueError(f"Unknown state: {state_context.current_state}")
+            response = await handler(state_context, user_prompt)
 
             return response
 
@@ -404,6 +422,159 @@ class DirectorAgent:
                 logger.error(f"Error processing state {state_context.current_state}: {error_msg}")
             raise
 
+    def _prepare_user_prompt(self, state_context: StateContext) -> str:
+        """Build the user prompt for the current state and record token usage."""
+        session_data = state_context.session_data
+        state = state_context.current_state
+        session_id = session_data.get("id", "unknown")
+        user_intent = getattr(state_context, 'user_intent', None)
+
+        # Build context for the user prompt (system prompts are already embedded in agents)
+        context, user_prompt = self.context_builder.build_context(
+            state=state,
+            session_data={
+                "id": session_id,
+                "user_initial_request": session_data.get("user_initial_request"),
+                "clarifying_answers": session_data.get("clarifying_answers"),
+                "conversation_history": state_context.conversation_history,
+                # v3.0: Pass strawman data for content generation
+                "strawman": session_data.get("strawman"),
+                "presentation_strawman": session_data.get("presentation_strawman")
+            },
+            user_intent=user_intent.dict() if user_intent else None
+        )
+
+        # Track token usage
+        user_tokens = _count_tokens(user_prompt)
+        system_tokens = self.state_prompt_tokens.get(state, 0)
+
+        # Tracking is bookkeeping only; keep it off the LLM critical path
+        self._spawn_background(self.token_tracker.track_modular(
+            session_id,
+            state,
+            user_tokens,
+            system_tokens
+        ))
+
+        logger.info(
+            f"Processing - State: {state}, "
+            f"User Tokens: {user_tokens}, System Tokens: {system_tokens}, "
+            f"Total: {user_tokens + system_tokens}"
+        )
+
+        return user_prompt
+
+    async def _handle_greeting(self, state_context: StateContext, user_prompt: str) -> str:
+        """PROVIDE_GREETING: simple string greeting."""
+        response = await self._run_cached(
+            self.greeting_agent,
+            str,
+            state_context.current_state,
+            user_prompt,
+            self._settings["PROVIDE_GREETING"]
+        )
+        logger.info("Generated greeting")
+        return response
+
+    async def _handle_questions(self, state_context: StateContext, user_prompt: str) -> ClarifyingQuestions:
+        """ASK_CLARIFYING_QUESTIONS: structured clarifying questions."""
+        response = await self._run_cached(
+            self.questions_agent,
+            ClarifyingQuestions,
+            state_context.current_state,
+            user_prompt,
+            self._settings["ASK_CLARIFYING_QUESTIONS"]
+        )
+        logger.info(f"Generated {len(response.questions)} clarifying questions")
+        return response
+
+    async def _handle_plan(self, state_context: StateContext, user_prompt: str) -> ConfirmationPlan:
+        """CREATE_CONFIRMATION_PLAN: high-level plan for user approval."""
+        response = await self._run_cached(
+            self.plan_agent,
+            ConfirmationPlan,
+            state_context.current_state,
+            user_prompt,
+            self._settings["CREATE_CONFIRMATION_PLAN"]
+        )
+        logger.info(f"Generated confirmation plan with {response.proposed_slide_count} slides")
+        return response
+
+    async def _handle_generate_strawman(
+        self, state_context: StateContext, user_prompt: str
+    ) -> Union[PresentationStrawman, Dict[str, Any]]:
+        """GENERATE_STRAWMAN: new strawman, published to deck-builder when enabled."""
+        logger.info("Generating strawman presentation")
+        return await self._handle_strawman_like(self.strawman_agent, user_prompt, refined=False)
+
+    async def _handle_refine_strawman(
+        self, state_context: StateContext, user_prompt: str
+    ) -> Union[PresentationStrawman, Dict[str, Any]]:
+        """REFINE_STRAWMAN: revised strawman, published to deck-builder when enabled."""
+        logger.info("Refining strawman presentation")
+        return await self._handle_strawman_like(self.refine_strawman_agent, user_prompt, refined=True)
+
+    async def _handle_strawman_like(
+        self, agent: Agent, user_prompt: str, refined: bool
+    ) -> Union[PresentationStrawman, Dict[str, Any]]:
+        """
+        Shared GENERATE/REFINE flow: run the agent, format assets, and send to deck-builder.
+
+        Returns a presentation_url response when the deck-builder call succeeds,
+        otherwise the strawman itself.
+        """
+        label = "refined " if refined else ""
+
+        result = await agent.run(
+            user_prompt,
+            model_settings=self._settings["REFINE_STRAWMAN" if refined else "GENERATE_STRAWMAN"]
+        )
+        strawman = result.output  # PresentationStrawman object
+        logger.info(f"{'Refined' if refined else 'Generated'} strawman with {len(strawman.slides)} slides")
+        logger.debug(f"First slide: {strawman.slides[0].slide_id if strawman.slides else 'No slides'}")
+
+        # Post-process to ensure asset fields are in correct format
+        # (CPU-bound; run off the event loop so other sessions keep flowing)
+        strawman = await asyncio.to_thread(AssetFormatter.format_strawman, strawman)
+        logger.info(f"Applied asset field formatting to {label}strawman")
+
+        # v2.0: Transform and send to deck-builder API
+        if not self._deck_builder_available():
+            return strawman
+
+        try:
+            logger.info(f"Transforming {label}presentation for deck-builder")
+            api_payload = await asyncio.to_thread(
+                self.content_transformer.transform_presentation, strawman
+            )
+            logger.debug(f"Transformed to {len(api_payload['slides'])} deck-builder slides")
+
+            logger.info("Calling deck-builder API")
+            api_response = await self.deck_builder_client.create_presentation(api_payload)
+            presentation_url = self.deck_builder_client.get_full_url(api_response['url'])
+
+            logger.info(f"✅ {'Refined presentation' if refined else 'Presentation'} created: {presentation_url}")
+
+            # Return URL response instead of strawman
+            return {
+                "type": "presentation_url",
+                "url": presentation_url,
+                "presentation_id": api_response['id'],
+                "slide_count": len(strawman.slides),
+                "message": f"Your {label}presentation is ready! View it at: {presentation_url}"
+            }
+        except Exception as e:
+            logger.error(f"Deck-builder API failed: {e}", exc_info=True)
+            logger.warning("Falling back to JSON response")
+            return strawman
+
+    @staticmethod
+    def _coerce_strawman(strawman_data: Any) -> PresentationStrawman:
+        """Return strawman_data as a PresentationStrawman, validating dicts."""
+        if isinstance(strawman_data, PresentationStrawman):
+            return strawman_data
+        return PresentationStrawman.model_validate(strawman_data)
+
     async def process_content_generation(
         self,
         state_context: StateContext,
@@ -420,45 +591,47 @@ class DirectorAgent:
             String message or enriched presentation response
         """
         try:
+            session_data = state_context.session_data
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
             # DEBUG: Log what we received
-            logger.info(f"[CONTENT_GENERATION] process_content_generation called")
-            logger.info(f"[CONTENT_GENERATION] session_data keys: {list(state_context.session_data.keys())}")
+            if debug_enabled:
+                logger.debug("[CONTENT_GENERATION] process_content_generation called")
+                logger.debug(f"[CONTENT_GENERATION] session_data keys: {list(session_data)}")
 
             # Get strawman from session data
-            strawman_data = state_context.session_data.get('strawman')
-            logger.info(f"[CONTENT_GENERATION] strawman_data type: {type(strawman_data)}")
+            strawman_data = session_data.get('strawman')
 
             if not strawman_data:
                 logger.error("[CONTENT_GENERATION] ❌ No strawman found in session data")
-                logger.error(f"[CONTENT_GENERATION] Available keys: {list(state_context.session_data.keys())}")
+                logger.error(f"[CONTENT_GENERATION] Available keys: {list(session_data)}")
                 # Try alternate keys
                 for alt_key in ['presentation_strawman', 'refined_strawman']:
-                    if alt_key in state_context.session_data:
+                    if alt_key in session_data:
                         logger.info(f"[CONTENT_GENERATION] Found alternate key: {alt_key}")
-                        strawman_data = state_context.session_data.get(alt_key)
+                        strawman_data = session_data[alt_key]
                         break
 
             if not strawman_data:
                 logger.error("[CONTENT_GENERATION] Still no strawman found after checking alternates")
                 return "Error: No presentation outline found. Please generate a strawman first."
 
-            logger.info(f"[CONTENT_GENERATION] ✓ Got strawman_data, type: {type(strawman_data)}")
+            if debug_enabled:
+                logger.debug(f"[CONTENT_GENERATION] ✓ Got strawman_data, type: {type(strawman_data)}")
 
-            # Convert to PresentationStrawman object if it's a dict
-            if isinstance(strawman_data, dict):
-                strawman = PresentationStrawman.model_validate(strawman_data)
-            else:
-                strawman = strawman_data
+            # Session dicts round-trip through storage, so they are validated;
+            # an in-memory PresentationStrawman is used as-is
+            strawman = self._coerce_strawman(strawman_data)
 
             logger.info(f"Processing content generation for {len(strawman.slides)} slides")
 
             # Check if content orchestrator is enabled
-            if not self.content_orchestrator_enabled:
+            if not self._content_orchestrator_available():
                 logger.warning("Content Orchestrator is disabled, falling back to v2.0 behavior")
                 result = await self.content_agent.run(
                     "Content Orchestrator is not available. Please inform the user that "
                     "we'll proceed with placeholder content (v2.0 behavior).",
-                    model_settings=ModelSettings(temperature=0.7, max_tokens=500)
+                    model_settings=self._orchestrator_disabled_settings
                 )
                 return result.output
 
@@ -492,7 +665,7 @@ Focus on what was successfully generated and offer next steps.
 
                 result = await self.content_agent.run(
                     success_prompt,
-                    model_settings=ModelSettings(temperature=0.7, max_tokens=800)
+                    model_settings=self._settings["CONTENT_GENERATION"]
                 )
 
                 logger.info("Content generation successful")
@@ -529,7 +702,7 @@ Keep the tone positive and solution-oriented.
 
                 result = await self.content_agent.run(
                     error_prompt,
-                    model_settings=ModelSettings(temperature=0.7, max_tokens=800)
+                    model_settings=self._settings["CONTENT_GENERATION"]
                 )
 
                 return {
@@ -543,6 +716,35 @@ Keep the tone positive and solution-oriented.
             logger.error(f"Error in process_content_generation: {e}", exc_info=True)
             return f"An error occurred during content generation: {str(e)}"
 
+    def _spawn_background(self, coro) -> None:
+        """Schedule a fire-and-forget coroutine and keep a reference until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and log any failure."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background task failed: {task.exception()}")
+
+    async def shutdown(self) -> None:
+        """
+        Wait for pending background tasks and release HTTP sessions.
+
+        Also closes the process-wide aiohttp session used by the orchestration
+        clients; it is recreated on first use if another agent still needs it.
+        """
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        orchestrator = self.__dict__.get("content_orchestrator")
+        if orchestrator is not None:
+            await orchestrator.aclose()
+        await close_shared_aiohttp_session()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
     def get_token_report(self, session_id: str) -> dict:
         """Get token usage report for a specific session."""
         return self.token_tracker.get_savings_report(session_id)
@@ -0,0 +1,60 @@
+"""
+Bounded Batch Execution
+=======================
+
+Shared helper for the clients' generate_batch methods: runs one coroutine
+per request under a TaskGroup, optionally capped by a semaphore, and
+returns results in request order.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Concurrent requests a real client keeps open against its service
+DEFAULT_BATCH_CONCURRENCY = 32
+
+
+async def run_batch(
+    func: Callable[[Any], Awaitable[T]],
+    items: List[Any],
+    max_concurrency: Optional[int] = None
+) -> List[T]:
+    """
+    Await func(item) for every item, preserving order.
+
+    Args:
+        func: Coroutine function called once per item
+        items: Inputs to process
+        max_concurrency: Maximum calls in flight at once (None = unlimited)
+
+    Returns:
+        Results in the same order as items
+
+    Raises:
+        Exception: The failing call's own exception when one call fails
+            (remaining calls are cancelled), so callers keep catching the
+            same types as for a single generate()
+        ExceptionGroup: If several calls fail before the rest are cancelled
+    """
+    results: List[Optional[T]] = [None] * len(items)
+    sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def _run(i: int, item: Any) -> None:
+        if sem is None:
+            results[i] = await func(item)
+        else:
+            async with sem:
+                results[i] = await func(item)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for i, item in enumerate(items):
+                tg.create_task(_run(i, item))
+    except ExceptionGroup as eg:
+        if len(eg.exceptions) == 1:
+            raise eg.exceptions[0] from None
+        raise
+
+    return results
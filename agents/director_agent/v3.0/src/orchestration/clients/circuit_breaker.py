@@ -0,0 +1,173 @@
+"""
+Circuit Breaker
+===============
+
+Fast-fail guard for the real service clients. After a run of consecutive
+service failures (timeouts, connection errors, 5xx/429 responses) the
+breaker opens and calls fail immediately for a cool-down period instead of
+each waiting out its own timeouts. Once the cool-down elapses a single probe
+call is let through (half-open): its success closes the breaker, its failure
+re-opens it.
+
+Client errors (4xx) and jobs the service reports as failed mean the service
+answered, so they never count against the breaker.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import aiohttp
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures before the breaker opens
+DEFAULT_FAILURE_THRESHOLD = 5
+
+# Seconds to fail fast before letting calls through again
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+# HTTP statuses meaning the service itself is failing or shedding load
+SERVICE_FAILURE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+def is_service_failure(error: BaseException) -> bool:
+    """
+    Whether an error means the service is unreachable or failing.
+
+    True for timeouts, connection errors and SERVICE_FAILURE_STATUSES
+    responses from either the aiohttp or the requests clients. Note
+    requests.RequestException subclasses OSError, so requests errors are
+    classified before the generic OSError fallback.
+    """
+    if isinstance(error, (TimeoutError, requests.Timeout)):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in SERVICE_FAILURE_STATUSES
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in SERVICE_FAILURE_STATUSES
+    if isinstance(error, requests.RequestException):
+        return isinstance(error, requests.ConnectionError)
+    return isinstance(error, (aiohttp.ClientConnectionError, OSError))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Usage:
+        with breaker.guard():
+            result = await call_service()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Service name for logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at = 0.0
+        # A half-open probe call is in flight
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being short-circuited (cool-down running)."""
+        return (
+            self._failures >= self.failure_threshold
+            and time.monotonic() - self._opened_at < self.reset_timeout
+        )
+
+    def before_call(self) -> bool:
+        """
+        Check the circuit before calling the service.
+
+        Once the cool-down elapses only one caller is let through as the
+        probe; the rest keep failing fast until it finishes.
+
+        Returns:
+            True if this call is the half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is in flight)
+        """
+        if self._failures < self.failure_threshold:
+            return False
+
+        elapsed = time.monotonic() - self._opened_at
+        if elapsed < self.reset_timeout:
+            raise CircuitOpenError(
+                f"{self.name} circuit open after {self._failures} consecutive failures "
+                f"(retry in {self.reset_timeout - elapsed:.0f}s)"
+            )
+        if self._probing:
+            raise CircuitOpenError(f"{self.name} circuit half-open, waiting on probe call")
+
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._failures >= self.failure_threshold:
+            logger.info(f"{self.name} circuit closed")
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening (or re-opening) the circuit at the threshold."""
+        self._failures += 1
+        self._probing = False
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                f"{self.name} circuit open for {self.reset_timeout:.0f}s "
+                f"after {self._failures} consecutive failures"
+            )
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Guard one service call: fail fast while open, then record its outcome.
+
+        Service failures (is_service_failure) count against the circuit; any
+        other error means the service answered and counts as a success. A
+        cancelled probe just frees the probe slot.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        probe = self.before_call()
+        try:
+            yield
+        except Exception as e:
+            if is_service_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            if probe:
+                self._probing = False
+            raise
+        self.record_success()
@@ -0,0 +1,105 @@
+"""
+Shared HTTP Session
+===================
+
+Factories for the pooled HTTP sessions shared by the real service clients,
+so their calls reuse keep-alive connections instead of each client opening
+its own pool:
+
+- create_shared_session(): requests.Session for the executor-based clients
+- get_shared_aiohttp_session(): process-wide aiohttp.ClientSession for the
+  asyncio-native clients
+"""
+
+import asyncio
+from typing import Optional, Set
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+# Enough pooled connections per host for a fully parallel deck
+DEFAULT_POOL_MAXSIZE = 32
+
+# aiohttp connector limits: total sockets, idle keep-alive, DNS cache TTL (s)
+AIOHTTP_CONNECTION_LIMIT = 200
+AIOHTTP_KEEPALIVE_TIMEOUT = 75
+AIOHTTP_DNS_CACHE_TTL = 300
+
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+_aiohttp_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Close tasks for sessions left behind by a previous event loop
+_closing: Set[asyncio.Task] = set()
+
+
+def create_shared_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a requests.Session with a connection pool sized for parallel dispatch.
+
+    Args:
+        pool_maxsize: Maximum pooled connections kept per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_aiohttp_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
+
+    Must be called from a coroutine. A new session is created if the previous
+    one was closed or belongs to a different event loop; in the latter case
+    the old session is closed rather than leaked.
+
+    Returns:
+        Shared aiohttp.ClientSession
+    """
+    global _aiohttp_session, _aiohttp_loop
+
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is None or _aiohttp_session.closed or _aiohttp_loop is not loop:
+        if _aiohttp_session is not None and not _aiohttp_session.closed:
+            _close_stale_session(_aiohttp_session, _aiohttp_loop, loop)
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=AIOHTTP_CONNECTION_LIMIT,
+                keepalive_timeout=AIOHTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=AIOHTTP_DNS_CACHE_TTL
+            )
+        )
+        _aiohttp_loop = loop
+    return _aiohttp_session
+
+
+def _close_stale_session(
+    session: aiohttp.ClientSession,
+    session_loop: asyncio.AbstractEventLoop,
+    loop: asyncio.AbstractEventLoop
+) -> None:
+    """Close a session bound to another event loop without blocking this one."""
+    if session_loop.is_running():
+        # Still serving another thread: close it there
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        return
+
+    # Its loop has stopped, so close it from the current one
+    task = loop.create_task(session.close())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def close_shared_aiohttp_session() -> None:
+    """Close the shared aiohttp session, if one is open."""
+    global _aiohttp_session, _aiohttp_loop
+
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+    _aiohttp_loop = None
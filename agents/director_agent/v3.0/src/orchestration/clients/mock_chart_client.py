@@ -9,12 +9,98 @@ In production, this will be replaced with real chart generation API client.
 
 import asyncio
 import logging
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Optional
 
 from orchestration.models.director_models import GeneratedChart
 
 logger = logging.getLogger(__name__)
 
+# Used when a request has no dimensions (shared; never mutated)
+_DEFAULT_DIMENSIONS = {"width": 800, "height": 400}
+
+# Static Chart.js templates, built once at import instead of per call
+_REVENUE_DATA = {
+    "labels": ["Q4 '24", "Q1 '25", "Q2 '25", "Q3 '25"],
+    "datasets": [
+        {
+            "label": "Revenue ($M)",
+            "data": [95, 107, 118, 127],
+            "backgroundColor": ["#e0e0e0", "#e0e0e0", "#e0e0e0", "#007bff"],
+            "borderColor": "#333",
+            "borderWidth": 1
+        }
+    ]
+}
+
+_MARGIN_DATA = {
+    "labels": ["Q1", "Q2", "Q3", "Q4"],
+    "datasets": [
+        {
+            "label": "EBITDA Margin (%)",
+            "data": [28.5, 29.8, 31.2, 32.3],
+            "borderColor": "#007bff",
+            "backgroundColor": "rgba(0, 123, 255, 0.1)",
+            "fill": True,
+            "tension": 0.4
+        }
+    ]
+}
+
+_COST_DATA = {
+    "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
+    "datasets": [
+        {
+            "label": "Operating Costs ($M)",
+            "data": [45, 43, 40, 38, 35, 32],
+            "borderColor": "#dc3545",
+            "backgroundColor": "rgba(220, 53, 69, 0.1)",
+            "fill": True
+        }
+    ]
+}
+
+_MARKET_DATA = {
+    "labels": ["Us", "Competitor A", "Competitor B", "Others"],
+    "datasets": [
+        {
+            "label": "Market Share (%)",
+            "data": [23.5, 19.2, 15.8, 41.5],
+            "backgroundColor": ["#007bff", "#6c757d", "#6c757d", "#e0e0e0"]
+        }
+    ]
+}
+
+_GENERIC_DATA = {
+    "labels": ["Jan", "Feb", "Mar", "Apr"],
+    "datasets": [
+        {
+            "label": "Metric",
+            "data": [12, 19, 15, 25],
+            "backgroundColor": "#007bff"
+        }
+    ]
+}
+
+# Content keyword rules in priority order, as one case-insensitive anchored
+# alternation (first branch whose keyword appears wins; m.lastgroup names it)
+_CONTENT_PATTERN = re.compile(
+    r"^(?:"
+    r"(?=.*revenue)(?P<revenue>)"
+    r"|(?=.*(?:margin|ebitda))(?P<margin>)"
+    r"|(?=.*cost)(?P<cost>)"
+    r"|(?=.*market)(?P<market>)"
+    r")",
+    re.IGNORECASE | re.DOTALL
+)
+
+_CHART_TEMPLATES = {
+    "revenue": _REVENUE_DATA,
+    "margin": _MARGIN_DATA,
+    "cost": _COST_DATA,
+    "market": _MARKET_DATA,
+}
+
 
 class MockChartClient:
     """
@@ -31,6 +117,7 @@ class MockChartClient:
             delay_ms: Simulated API delay in milliseconds
         """
         self.delay_ms = delay_ms
+        self._delay_s = delay_ms / 1000.0
         logger.info(f"MockChartClient initialized (delay: {delay_ms}ms)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedChart:
@@ -44,106 +131,54 @@ class MockChartClient:
             GeneratedChart with Chart.js data
         """
         # Simulate API delay
-        await asyncio.sleep(self.delay_ms / 1000.0)
+        await asyncio.sleep(self._delay_s)
+
+        return self._build_result(request)
 
+    def _build_result(self, request: Dict[str, Any]) -> GeneratedChart:
+        """Build the mock result for one request (no delay, no validation)."""
         chart_type = request.get("chart_type", "bar")
-        content = request.get("content", "").lower()
+        content = request.get("content", "")
         goal = request.get("goal", "")
-        dimensions = request.get("dimensions", {"width": 800, "height": 400})
-
-        # Generate realistic Chart.js data based on content
-        if "revenue" in content:
-            data = {
-                "labels": ["Q4 '24", "Q1 '25", "Q2 '25", "Q3 '25"],
-                "datasets": [
-                    {
-                        "label": "Revenue ($M)",
-                        "data": [95, 107, 118, 127],
-                        "backgroundColor": ["#e0e0e0", "#e0e0e0", "#e0e0e0", "#007bff"],
-                        "borderColor": "#333",
-                        "borderWidth": 1
-                    }
-                ]
-            }
-        elif "margin" in content or "ebitda" in content:
-            data = {
-                "labels": ["Q1", "Q2", "Q3", "Q4"],
-                "datasets": [
-                    {
-                        "label": "EBITDA Margin (%)",
-                        "data": [28.5, 29.8, 31.2, 32.3],
-                        "borderColor": "#007bff",
-                        "backgroundColor": "rgba(0, 123, 255, 0.1)",
-                        "fill": True,
-                        "tension": 0.4
-                    }
-                ]
-            }
-        elif "cost" in content:
-            data = {
-                "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
-                "datasets": [
-                    {
-                        "label": "Operating Costs ($M)",
-                        "data": [45, 43, 40, 38, 35, 32],
-                        "borderColor": "#dc3545",
-                        "backgroundColor": "rgba(220, 53, 69, 0.1)",
-                        "fill": True
-                    }
-                ]
-            }
-        elif "market" in content:
-            data = {
-                "labels": ["Us", "Competitor A", "Competitor B", "Others"],
-                "datasets": [
-                    {
-                        "label": "Market Share (%)",
-                        "data": [23.5, 19.2, 15.8, 41.5],
-                        "backgroundColor": ["#007bff", "#6c757d", "#6c757d", "#e0e0e0"]
-                    }
-                ]
-            }
-        else:
-            # Generic data
-            data = {
-                "labels": ["Jan", "Feb", "Mar", "Apr"],
-                "datasets": [
-                    {
-                        "label": "Metric",
-                        "data": [12, 19, 15, 25],
-                        "backgroundColor": "#007bff"
-                    }
-                ]
-            }
+        dimensions = request.get("dimensions") or _DEFAULT_DIMENSIONS
+
+        # Pick realistic Chart.js data based on content. Templates are shared,
+        # read-only module constants; each chart gets its own top-level dict.
+        m = _CONTENT_PATTERN.match(content)
+        data = _CHART_TEMPLATES[m.lastgroup] if m else _GENERIC_DATA
 
         # Generate URL (mock CDN)
         url = f"https://cdn.example.com/charts/chart-{chart_type}-{request.get('slide_number', '000')}.png"
 
-        return GeneratedChart(
+        return GeneratedChart.model_construct(
             type=chart_type,
-            data=data,
+            data=dict(data),
             url=url,
             metadata={
                 "source": "mock_chart_client",
                 "goal": goal,
-                "dimensions": dimensions,
+                "dimensions": dict(dimensions),
                 "delay_ms": self.delay_ms
             }
         )
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedChart]:
         """
         Generate batch of charts.
 
+        The simulated delay is uniform, so the whole batch waits once
+        instead of once per request.
+
         Args:
             requests: List of request dicts
+            max_concurrency: Accepted for parity with the real clients (unused)
 
         Returns:
-            List of GeneratedChart
+            List of GeneratedChart, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        await asyncio.sleep(self._delay_s)
+        return [self._build_result(req) for req in requests]
@@ -9,7 +9,7 @@ In production, this will be replaced with real diagram generation API client.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from orchestration.models.director_models import GeneratedDiagram
 
@@ -31,6 +31,7 @@ class MockDiagramClient:
             delay_ms: Simulated API delay in milliseconds
         """
         self.delay_ms = delay_ms
+        self._delay_s = delay_ms / 1000.0
         logger.info(f"MockDiagramClient initialized (delay: {delay_ms}ms)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedDiagram:
@@ -44,8 +45,12 @@ class MockDiagramClient:
             GeneratedDiagram with URL
         """
         # Simulate API delay
-        await asyncio.sleep(self.delay_ms / 1000.0)
+        await asyncio.sleep(self._delay_s)
 
+        return self._build_result(request)
+
+    def _build_result(self, request: Dict[str, Any]) -> GeneratedDiagram:
+        """Build the mock result for one request (no delay, no validation)."""
         diagram_type = request.get("diagram_type", "flowchart")
         goal = request.get("goal", "")
         content = request.get("content", "")
@@ -54,7 +59,7 @@ class MockDiagramClient:
         # Generate URL
         url = f"https://cdn.example.com/diagrams/{diagram_type}-{slide_number}.svg"
 
-        return GeneratedDiagram(
+        return GeneratedDiagram.model_construct(
             type=diagram_type,
             url=url,
             metadata={
@@ -67,17 +72,21 @@ class MockDiagramClient:
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedDiagram]:
         """
         Generate batch of diagrams.
 
+        The simulated delay is uniform, so the whole batch waits once
+        instead of once per request.
+
         Args:
             requests: List of request dicts
+            max_concurrency: Accepted for parity with the real clients (unused)
 
         Returns:
-            List of GeneratedDiagram
+            List of GeneratedDiagram, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        await asyncio.sleep(self._delay_s)
+        return [self._build_result(req) for req in requests]
@@ -9,12 +9,18 @@ In production, this will be replaced with real image generation API client.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from orchestration.models.director_models import GeneratedImage
 
 logger = logging.getLogger(__name__)
 
+# Used when a request has no dimensions (shared; never mutated)
+_DEFAULT_DIMENSIONS = {"width": 1600, "height": 900, "aspect_ratio": "16:9"}
+
+# URL slugs for the common aspect ratios ("16:9" -> "16x9")
+_ASPECT_SLUGS = {"16:9": "16x9", "4:3": "4x3", "1:1": "1x1", "9:16": "9x16", "3:2": "3x2", "21:9": "21x9"}
+
 
 class MockImageClient:
     """
@@ -31,6 +37,7 @@ class MockImageClient:
             delay_ms: Simulated API delay in milliseconds
         """
         self.delay_ms = delay_ms
+        self._delay_s = delay_ms / 1000.0
         logger.info(f"MockImageClient initialized (delay: {delay_ms}ms)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedImage:
@@ -44,16 +51,17 @@ class MockImageClient:
             GeneratedImage with URL and caption
         """
         # Simulate API delay
-        await asyncio.sleep(self.delay_ms / 1000.0)
+        await asyncio.sleep(self._delay_s)
 
-        goal = request.get("goal", "")
-        content = request.get("content", "")
-        style = request.get("style", "")
-        dimensions = request.get("dimensions", {
-            "width": 1600,
-            "height": 900,
-            "aspect_ratio": "16:9"
-        })
+        return self._build_result(request)
+
+    def _build_result(self, request: Dict[str, Any]) -> GeneratedImage:
+        """Build the mock result for one request (no delay, no validation)."""
+        get = request.get
+        goal = get("goal", "")
+        content = get("content", "")
+        style = get("style", "")
+        dimensions = get("dimensions") or _DEFAULT_DIMENSIONS
 
         # Generate caption from goal or content
         if goal:
@@ -65,36 +73,39 @@ class MockImageClient:
 
         # Generate URL based on aspect ratio and slide number
         aspect_ratio = dimensions.get("aspect_ratio", "16:9")
-        width = dimensions.get("width", 1600)
-        height = dimensions.get("height", 900)
-        slide_number = request.get("slide_number", "000")
+        slide_number = get("slide_number", "000")
 
-        url = f"https://cdn.example.com/images/{aspect_ratio.replace(':', 'x')}-{slide_number}.jpg"
+        aspect_slug = _ASPECT_SLUGS.get(aspect_ratio) or aspect_ratio.replace(":", "x")
+        url = f"https://cdn.example.com/images/{aspect_slug}-{slide_number}.jpg"
 
-        return GeneratedImage(
+        return GeneratedImage.model_construct(
             url=url,
             caption=caption,
             metadata={
                 "source": "mock_image_client",
                 "style": style,
-                "dimensions": dimensions,
+                "dimensions": dict(dimensions),
                 "delay_ms": self.delay_ms
             }
         )
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedImage]:
         """
         Generate batch of images.
 
+        The simulated delay is uniform, so the whole batch waits once
+        instead of once per request.
+
         Args:
             requests: List of request dicts
+            max_concurrency: Accepted for parity with the real clients (unused)
 
         Returns:
-            List of GeneratedImage
+            List of GeneratedImage, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        await asyncio.sleep(self._delay_s)
+        return [self._build_result(req) for req in requests]
@@ -9,7 +9,7 @@ In production, this will be replaced with real text generation API client.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from orchestration.models.director_models import GeneratedText
 
@@ -31,6 +31,7 @@ class MockTextClient:
             delay_ms: Simulated API delay in milliseconds
         """
         self.delay_ms = delay_ms
+        self._delay_s = delay_ms / 1000.0
         logger.info(f"MockTextClient initialized (delay: {delay_ms}ms)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedText:
@@ -44,8 +45,12 @@ class MockTextClient:
             GeneratedText
         """
         # Simulate API delay
-        await asyncio.sleep(self.delay_ms / 1000.0)
+        await asyncio.sleep(self._delay_s)
 
+        return self._build_result(request)
+
+    def _build_result(self, request: Dict[str, Any]) -> GeneratedText:
+        """Build the mock result for one request (no delay, no validation)."""
         topics = request.get("topics", [])
         narrative = request.get("narrative", "")
         context = request.get("context", {})
@@ -91,7 +96,7 @@ class MockTextClient:
         if max_chars and len(content) > max_chars:
             content = content[:max_chars - 3] + "..."
 
-        return GeneratedText(
+        return GeneratedText.model_construct(
             content=content,
             metadata={
                 "word_count": len(content.split()),
@@ -103,17 +108,21 @@ class MockTextClient:
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedText]:
         """
         Generate batch of texts.
 
+        The simulated delay is uniform, so the whole batch waits once
+        instead of once per request.
+
         Args:
             requests: List of request dicts
+            max_concurrency: Accepted for parity with the real clients (unused)
 
         Returns:
-            List of GeneratedText
+            List of GeneratedText, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        await asyncio.sleep(self._delay_s)
+        return [self._build_result(req) for req in requests]
@@ -13,17 +13,42 @@ Service Details:
 """
 
 import os
+import re
 import asyncio
 import logging
-from typing import Dict, Any
-import requests
+from typing import Dict, Any, Optional
+import aiohttp
+import orjson
 from dotenv import load_dotenv
 
 from orchestration.models.director_models import GeneratedChart
+from orchestration.clients.http_session import get_shared_aiohttp_session
+from orchestration.clients.circuit_breaker import CircuitBreaker
+from orchestration.clients.response_cache import ResponseCache, InflightRequests, request_cache_key
+from orchestration.clients.batching import run_batch, DEFAULT_BATCH_CONCURRENCY
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Per-request timeouts (seconds) for job submission and status checks
+SUBMIT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+STATUS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Analytics theme used when the request carries no theme name
+DEFAULT_THEME = "professional"
+
+# Maximum number of generated charts memoized per client
+CACHE_MAX_ENTRIES = 256
+
+# Status values that mean "keep polling"; bodies carrying one are not fully parsed
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"(pending|processing)"')
+
+# Status polling backoff: first check after 100ms, growing 1.5x up to poll_interval
+POLL_INITIAL_DELAY = 0.1
+POLL_BACKOFF_FACTOR = 1.5
+
 
 class RealChartClient:
     """
@@ -32,12 +57,13 @@ class RealChartClient:
     Integrates with production Railway deployment using async job polling pattern.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize chart/analytics service client.
 
         Args:
             base_url: Override URL (default: from CHART_SERVICE_URL env var)
+            session: aiohttp session to use (default: the shared orchestration session)
         """
         self.base_url = base_url or os.getenv(
             "CHART_SERVICE_URL",
@@ -46,9 +72,23 @@ class RealChartClient:
         self.timeout = int(os.getenv("CHART_SERVICE_TIMEOUT", "60"))
         self.poll_interval = int(os.getenv("CHART_POLL_INTERVAL", "2"))
 
+        # Derived once per client rather than per job/poll
+        self._generate_url = f"{self.base_url}/generate"
+        self._status_url_prefix = f"{self.base_url}/status/"
+
+        # Fail fast while the Analytics service is unreachable
+        self._breaker = CircuitBreaker("Chart service")
+
+        self._session = session
+
+        # LRU memo of completed charts keyed by the normalized service request
+        self._cache: ResponseCache[GeneratedChart] = ResponseCache(CACHE_MAX_ENTRIES)
+        # Jobs currently running, so concurrent duplicates share one backend job
+        self._inflight: InflightRequests[GeneratedChart] = InflightRequests()
+
         logger.info(f"RealChartClient initialized (url: {self.base_url}, timeout: {self.timeout}s, poll: {self.poll_interval}s)")
 
-    async def generate(self, request: Dict[str, Any]) -> GeneratedChart:
+    async def generate(self, request: Dict[str, Any], cache: bool = True) -> GeneratedChart:
         """
         Generate chart from production service using job polling.
 
@@ -60,6 +100,7 @@ class RealChartClient:
                 - data: Dict - Chart data
                 - theme: Dict - Primary color, background color
                 - slide_number: int - For reference
+            cache: Reuse a previously generated chart for an identical request
 
         Returns:
             GeneratedChart with URL, data, and metadata
@@ -67,29 +108,50 @@ class RealChartClient:
         # Transform request to service format
         service_request = self._transform_request(request)
 
-        # Submit job (non-blocking)
-        loop = asyncio.get_event_loop()
-        job_response = await loop.run_in_executor(
-            None,
-            self._sync_submit_job,
-            service_request
-        )
+        key = request_cache_key(service_request)
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info(f"Chart cache hit for slide {request.get('slide_number', '?')}")
+                return cached
 
-        job_id = job_response.get("job_id")
-        if not job_id:
-            raise RuntimeError(f"Chart service did not return job_id: {job_response}")
+            # Join an identical job that is already running
+            if key in self._inflight:
+                logger.info(f"Chart job for slide {request.get('slide_number', '?')} joined in-flight request")
+            return await self._inflight.run(key, lambda: self._generate_job(key, service_request, request))
 
-        logger.info(f"Chart job submitted: {job_id}")
+        return await self._generate_job(key, service_request, request)
 
-        # Poll for completion (non-blocking)
-        result = await self._poll_job(job_id)
+    async def _generate_job(self, key: str, service_request: Dict, request: Dict[str, Any]) -> GeneratedChart:
+        """Submit, poll and transform one chart job, memoizing the result."""
+        with self._breaker.guard():
+            # Submit job
+            job_response = await self._submit_job(service_request)
+
+            job_id = job_response.get("job_id")
+            if not job_id:
+                raise RuntimeError(f"Chart service did not return job_id: {job_response}")
+
+            logger.info(f"Chart job submitted: {job_id}")
+
+            # Poll for completion (non-blocking)
+            result = await self._poll_job(job_id)
 
         # Transform response to orchestrator format
-        return self._transform_response(result, request)
+        chart = self._transform_response(result, request)
+
+        self._cache.put(key, chart)
+        return chart
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session, or the process-wide shared one."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_shared_aiohttp_session()
 
-    def _sync_submit_job(self, request: Dict) -> Dict:
+    async def _submit_job(self, request: Dict) -> Dict:
         """
-        Submit chart generation job (synchronous).
+        Submit chart generation job.
 
         Args:
             request: Service-formatted request
@@ -98,25 +160,27 @@ class RealChartClient:
             Job submission response with job_id
 
         Raises:
-            requests.HTTPError: On API errors
-            requests.Timeout: On timeout
+            aiohttp.ClientResponseError: On API errors
+            asyncio.TimeoutError: On timeout
         """
-        endpoint = f"{self.base_url}/generate"
+        endpoint = self._generate_url
 
         try:
-            response = requests.post(
+            async with self._get_session().post(
                 endpoint,
-                json=request,
-                timeout=10  # Short timeout for job submission
-            )
-            response.raise_for_status()
-            return response.json()
-
-        except requests.Timeout as e:
+                data=orjson.dumps(request, option=orjson.OPT_NON_STR_KEYS),
+                headers=JSON_HEADERS,
+                timeout=SUBMIT_TIMEOUT  # Short timeout for job submission
+            ) as response:
+                if response.status >= 400:
+                    logger.error(f"Chart service HTTP error: {response.status} - {await response.text()}")
+                    response.raise_for_status()
+                return orjson.loads(await response.read())
+
+        except asyncio.TimeoutError:
             logger.error(f"Chart service job submission timeout")
             raise
-        except requests.HTTPError as e:
-            logger.error(f"Chart service HTTP error: {e.response.status_code} - {e.response.text}")
+        except aiohttp.ClientResponseError:
             raise
         except Exception as e:
             logger.error(f"Chart service job submission failed: {str(e)}")
@@ -124,7 +188,7 @@ class RealChartClient:
 
     async def _poll_job(self, job_id: str) -> Dict:
         """
-        Poll job status until completion (async, non-blocking).
+        Poll job status until completion.
 
         Args:
             job_id: Job identifier from submission
@@ -136,22 +200,32 @@ class RealChartClient:
             RuntimeError: If job fails
             TimeoutError: If polling times out
         """
-        max_attempts = int(self.timeout / self.poll_interval)
-        loop = asyncio.get_event_loop()
-
-        for attempt in range(max_attempts):
-            # Non-blocking sleep
-            await asyncio.sleep(self.poll_interval)
-
-            # Check status (run in executor to avoid blocking)
-            status = await loop.run_in_executor(
-                None,
-                lambda: requests.get(
-                    f"{self.base_url}/status/{job_id}",
-                    timeout=10
-                ).json()
-            )
+        session = self._get_session()
+        status_url = f"{self._status_url_prefix}{job_id}"
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        delay = POLL_INITIAL_DELAY
+        attempt = 0
+
+        while loop.time() < deadline:
+            # Back off from a short first wait so fast jobs return quickly,
+            # growing to poll_interval for slow ones
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+            delay = min(delay * POLL_BACKOFF_FACTOR, self.poll_interval)
+            attempt += 1
+
+            # Check status
+            async with session.get(status_url, timeout=STATUS_TIMEOUT) as response:
+                raw = await response.read()
+
+            # Still running: read the status straight from the bytes and skip the
+            # full decode. Any body that could be terminal is parsed normally.
+            pending = _STATUS_RE.search(raw)
+            if pending and b'"completed"' not in raw and b'"failed"' not in raw:
+                logger.debug(f"Chart job {job_id} still {pending.group(1).decode()} (attempt {attempt})")
+                continue
 
+            status = orjson.loads(raw)
             job_status = status.get("status")
 
             if job_status == "completed":
@@ -162,7 +236,7 @@ class RealChartClient:
                 logger.error(f"Chart job {job_id} failed: {error}")
                 raise RuntimeError(f"Chart generation failed: {error}")
             elif job_status in ["pending", "processing"]:
-                logger.debug(f"Chart job {job_id} still {job_status} (attempt {attempt + 1}/{max_attempts})")
+                logger.debug(f"Chart job {job_id} still {job_status} (attempt {attempt})")
                 continue
             else:
                 logger.warning(f"Chart job {job_id} unknown status: {job_status}")
@@ -182,32 +256,24 @@ class RealChartClient:
             "theme": str  // Theme name: default, dark, professional, colorful, minimal
         }
         """
-        # Get data - ensure it's a list or omit it
-        data = orchestrator_request.get("data")
-        if data is not None and not isinstance(data, list):
-            data = None  # Service expects list or nothing
-
-        # Get theme - if dict provided, convert to theme name
-        theme = orchestrator_request.get("theme", {})
-        if isinstance(theme, dict):
-            # Use professional as default theme name
-            theme_name = "professional"
-        else:
-            theme_name = theme or "professional"
+        get = orchestrator_request.get
+
+        # Theme - a dict (colors) or empty value maps to the default theme name
+        theme = get("theme")
+        theme_name = theme if theme and isinstance(theme, str) else DEFAULT_THEME
 
         request = {
-            "content": orchestrator_request.get("content", ""),
-            "title": orchestrator_request.get("title", "Chart"),
-            "chart_type": orchestrator_request.get("chart_type", "bar")
+            "content": get("content", ""),
+            "title": get("title", "Chart"),
+            "chart_type": get("chart_type", "bar")
         }
 
-        # Only add data if it's a valid list
-        if data is not None:
+        # Data - service expects a list or nothing
+        data = get("data")
+        if isinstance(data, list):
             request["data"] = data
 
-        # Add theme
         request["theme"] = theme_name
-
         return request
 
     def _transform_response(self, service_response: Dict, original_request: Dict) -> GeneratedChart:
@@ -230,31 +296,34 @@ class RealChartClient:
         Returns:
             GeneratedChart model
         """
+        get = service_response.get
+        service_metadata = get("metadata") or {}
+
         return GeneratedChart(
-            type=service_response.get("chart_type", original_request.get("chart_type", "bar")),
-            data=service_response.get("chart_data", {}),
-            url=service_response.get("chart_url"),
+            type=get("chart_type", original_request.get("chart_type", "bar")),
+            data=get("chart_data", {}),
+            url=get("chart_url"),
             metadata={
-                "theme": service_response.get("theme"),
-                "generated_at": service_response.get("metadata", {}).get("generated_at"),
-                "data_points": service_response.get("metadata", {}).get("data_points"),
+                "theme": get("theme"),
+                "generated_at": service_metadata.get("generated_at"),
+                "data_points": service_metadata.get("data_points"),
                 "source": "analytics_service_v3"
             }
         )
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = DEFAULT_BATCH_CONCURRENCY
     ) -> list[GeneratedChart]:
         """
-        Generate batch of charts.
+        Generate batch of charts, one job per chart.
 
         Args:
             requests: List of request dicts
+            max_concurrency: Maximum requests in flight at once (default 32)
 
         Returns:
-            List of GeneratedChart
+            List of GeneratedChart, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        return await run_batch(self.generate, requests, max_concurrency)
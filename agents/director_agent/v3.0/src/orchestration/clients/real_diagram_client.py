@@ -13,17 +13,47 @@ Service Details:
 """
 
 import os
+import random
 import asyncio
 import logging
-from typing import Dict, Any
-import requests
+from typing import Dict, Any, Optional
+import aiohttp
+import orjson
 from dotenv import load_dotenv
 
 from orchestration.models.director_models import GeneratedDiagram
+from orchestration.clients.http_session import get_shared_aiohttp_session
+from orchestration.clients.response_cache import ResponseCache, InflightRequests, request_cache_key
+from orchestration.clients.circuit_breaker import CircuitBreaker
+from orchestration.clients.batching import run_batch
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Per-request timeouts (seconds) for job submission and status checks
+SUBMIT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+STATUS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Service theme sent when the request carries no theme overrides (read-only;
+# request dicts are only ever serialized)
+DEFAULT_DIAGRAM_THEME = {"primaryColor": "#3B82F6", "style": "modern"}
+
+# Default cap on concurrent requests from generate_batch (the service's sweet spot)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Maximum number of generated diagrams memoized per client
+CACHE_MAX_ENTRIES = 512
+
+# Service settings, read from the environment once at import
+DIAGRAM_SERVICE_URL = os.getenv("DIAGRAM_SERVICE_URL", "https://web-production-e0ad0.up.railway.app")
+DIAGRAM_SERVICE_TIMEOUT = int(os.getenv("DIAGRAM_SERVICE_TIMEOUT", "60"))
+DIAGRAM_MAX_CONCURRENCY = int(os.getenv("DIAGRAM_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+DIAGRAM_POLL_INTERVAL = int(os.getenv("DIAGRAM_POLL_INTERVAL", "2"))
+DIAGRAM_POLL_BACKOFF_MIN = float(os.getenv("DIAGRAM_POLL_BACKOFF_MIN", "0.05"))
+DIAGRAM_POLL_BACKOFF_MAX = float(os.getenv("DIAGRAM_POLL_BACKOFF_MAX", str(DIAGRAM_POLL_INTERVAL)))
+
 
 class RealDiagramClient:
     """
@@ -32,23 +62,50 @@ class RealDiagramClient:
     Integrates with production Railway deployment using async job polling pattern.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[int] = None
+    ):
         """
         Initialize diagram service client.
 
         Args:
             base_url: Override URL (default: from DIAGRAM_SERVICE_URL env var)
+            session: aiohttp session to use (default: the shared orchestration session)
+            timeout: Override job timeout in seconds (default: from DIAGRAM_SERVICE_TIMEOUT env var)
         """
-        self.base_url = base_url or os.getenv(
-            "DIAGRAM_SERVICE_URL",
-            "https://web-production-e0ad0.up.railway.app"
-        )
-        self.timeout = int(os.getenv("DIAGRAM_SERVICE_TIMEOUT", "60"))
-        self.poll_interval = int(os.getenv("DIAGRAM_POLL_INTERVAL", "2"))
+        self.base_url = base_url or DIAGRAM_SERVICE_URL
+        self.timeout = timeout or DIAGRAM_SERVICE_TIMEOUT
+        self.max_concurrency = DIAGRAM_MAX_CONCURRENCY
+        self.poll_interval = DIAGRAM_POLL_INTERVAL
+
+        # Polling backoff (s): start fast for Mermaid/cached SVGs, double up to the max
+        self.poll_backoff_min = DIAGRAM_POLL_BACKOFF_MIN
+        self.poll_backoff_max = DIAGRAM_POLL_BACKOFF_MAX
+
+        # Derived once per client rather than per job/poll
+        self._generate_url = f"{self.base_url}/generate"
+        self._status_url_prefix = f"{self.base_url}/status/"
+
+        self._session = session
+
+        # LRU memo of completed diagrams keyed by the normalized service request
+        self._cache: ResponseCache[GeneratedDiagram] = ResponseCache(CACHE_MAX_ENTRIES)
+        # Requests currently running, so concurrent duplicates share one service call
+        self._inflight: InflightRequests[GeneratedDiagram] = InflightRequests()
+
+        # Interned service theme dicts for overridden themes, keyed by
+        # (primaryColor, style); shared across requests and never mutated
+        self._theme_pool: Dict[tuple, Dict[str, str]] = {}
+
+        # Fail fast while the Diagram service is unreachable
+        self._breaker = CircuitBreaker("Diagram service")
 
         logger.info(f"RealDiagramClient initialized (url: {self.base_url}, timeout: {self.timeout}s, poll: {self.poll_interval}s)")
 
-    async def generate(self, request: Dict[str, Any]) -> GeneratedDiagram:
+    async def generate(self, request: Dict[str, Any], cache: bool = True) -> GeneratedDiagram:
         """
         Generate diagram from production service using job polling.
 
@@ -59,6 +116,7 @@ class RealDiagramClient:
                 - diagram_type: str - Type of diagram
                 - theme: Dict - Primary color, style
                 - slide_number: int - For reference
+            cache: Reuse a previously generated result for an identical request
 
         Returns:
             GeneratedDiagram with URL and metadata
@@ -66,29 +124,52 @@ class RealDiagramClient:
         # Transform request to service format
         service_request = self._transform_request(request)
 
-        # Submit job (non-blocking)
-        loop = asyncio.get_event_loop()
-        job_response = await loop.run_in_executor(
-            None,
-            self._sync_submit_job,
-            service_request
-        )
+        key = request_cache_key(service_request)
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info(f"Diagram cache hit for slide {request.get('slide_number', '?')}")
+                return cached
+
+            # Join an identical request that is already running
+            if key in self._inflight:
+                logger.info(f"Diagram request for slide {request.get('slide_number', '?')} joined in-flight request")
+            return await self._inflight.run(key, lambda: self._generate_uncached(key, service_request, request))
+
+        return await self._generate_uncached(key, service_request, request)
+
+    async def _generate_uncached(self, key: str, service_request: Dict, request: Dict[str, Any]) -> GeneratedDiagram:
+        """Call the service and transform the result, memoizing it."""
+        with self._breaker.guard():
+            # Submit job, then poll for completion (non-blocking)
+            job_id = await self._submit_for_job_id(service_request)
+            result = await self._poll_job(job_id)
+
+        # Transform response to orchestrator format
+        diagram = self._transform_response(result, request)
+        self._cache.put(key, diagram)
+        return diagram
+
+    async def _submit_for_job_id(self, service_request: Dict) -> str:
+        """Submit a job and return its job_id."""
+        job_response = await self._submit_job(service_request)
 
         job_id = job_response.get("job_id")
         if not job_id:
             raise RuntimeError(f"Diagram service did not return job_id: {job_response}")
 
         logger.info(f"Diagram job submitted: {job_id}")
+        return job_id
 
-        # Poll for completion (non-blocking)
-        result = await self._poll_job(job_id)
-
-        # Transform response to orchestrator format
-        return self._transform_response(result, request)
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session, or the process-wide shared one."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_shared_aiohttp_session()
 
-    def _sync_submit_job(self, request: Dict) -> Dict:
+    async def _submit_job(self, request: Dict) -> Dict:
         """
-        Submit diagram generation job (synchronous).
+        Submit diagram generation job.
 
         Args:
             request: Service-formatted request
@@ -97,25 +178,27 @@ class RealDiagramClient:
             Job submission response with job_id
 
         Raises:
-            requests.HTTPError: On API errors
-            requests.Timeout: On timeout
+            aiohttp.ClientResponseError: On API errors
+            asyncio.TimeoutError: On timeout
         """
-        endpoint = f"{self.base_url}/generate"
+        endpoint = self._generate_url
 
         try:
-            response = requests.post(
+            async with self._get_session().post(
                 endpoint,
-                json=request,
-                timeout=10  # Short timeout for job submission
-            )
-            response.raise_for_status()
-            return response.json()
-
-        except requests.Timeout as e:
+                data=orjson.dumps(request, option=orjson.OPT_NON_STR_KEYS),
+                headers=JSON_HEADERS,
+                timeout=SUBMIT_TIMEOUT  # Short timeout for job submission
+            ) as response:
+                if response.status >= 400:
+                    logger.error(f"Diagram service HTTP error: {response.status} - {await response.text()}")
+                    response.raise_for_status()
+                return orjson.loads(await response.read())
+
+        except asyncio.TimeoutError:
             logger.error(f"Diagram service job submission timeout")
             raise
-        except requests.HTTPError as e:
-            logger.error(f"Diagram service HTTP error: {e.response.status_code} - {e.response.text}")
+        except aiohttp.ClientResponseError:
             raise
         except Exception as e:
             logger.error(f"Diagram service job submission failed: {str(e)}")
@@ -135,21 +218,22 @@ class RealDiagramClient:
             RuntimeError: If job fails
             TimeoutError: If polling times out
         """
-        max_attempts = int(self.timeout / self.poll_interval)
-        loop = asyncio.get_event_loop()
-
-        for attempt in range(max_attempts):
-            # Non-blocking sleep
-            await asyncio.sleep(self.poll_interval)
-
-            # Check status (run in executor to avoid blocking)
-            status = await loop.run_in_executor(
-                None,
-                lambda: requests.get(
-                    f"{self.base_url}/status/{job_id}",
-                    timeout=10
-                ).json()
-            )
+        session = self._get_session()
+        status_url = f"{self._status_url_prefix}{job_id}"
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        delay = self.poll_backoff_min
+        attempt = 0
+
+        while loop.time() < deadline:
+            # Exponential backoff with jitter, never sleeping past the deadline
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+            delay = min(self.poll_backoff_max, delay * 2) + random.uniform(0, delay * 0.1)
+            attempt += 1
+
+            # Check status
+            async with session.get(status_url, timeout=STATUS_TIMEOUT) as response:
+                status = orjson.loads(await response.read())
 
             job_status = status.get("status")
 
@@ -161,7 +245,7 @@ class RealDiagramClient:
                 logger.error(f"Diagram job {job_id} failed: {error}")
                 raise RuntimeError(f"Diagram generation failed: {error}")
             elif job_status in ["pending", "processing"]:
-                logger.debug(f"Diagram job {job_id} still {job_status} (attempt {attempt + 1}/{max_attempts})")
+                logger.debug(f"Diagram job {job_id} still {job_status} (attempt {attempt})")
                 continue
             else:
                 logger.warning(f"Diagram job {job_id} unknown status: {job_status}")
@@ -182,18 +266,26 @@ class RealDiagramClient:
             }
         }
         """
-        # Extract theme colors
-        theme = orchestrator_request.get("theme", {})
-        primary_color = theme.get("primary_color", "#3B82F6")
-        style = theme.get("style", "modern")
+        get = orchestrator_request.get
+
+        # Extract theme colors (the orchestrator normally sends none)
+        theme = get("theme")
+        if theme:
+            primary_color = theme.get("primary_color", DEFAULT_DIAGRAM_THEME["primaryColor"])
+            style = theme.get("style", DEFAULT_DIAGRAM_THEME["style"])
+            service_theme = self._theme_pool.get((primary_color, style))
+            if service_theme is None:
+                service_theme = self._theme_pool[(primary_color, style)] = {
+                    "primaryColor": primary_color,
+                    "style": style
+                }
+        else:
+            service_theme = DEFAULT_DIAGRAM_THEME
 
         return {
-            "content": orchestrator_request.get("content", ""),
-            "diagram_type": orchestrator_request.get("diagram_type", "flowchart"),
-            "theme": {
-                "primaryColor": primary_color,
-                "style": style
-            }
+            "content": get("content", ""),
+            "diagram_type": get("diagram_type", "flowchart"),
+            "theme": service_theme
         }
 
     def _transform_response(self, service_response: Dict, original_request: Dict) -> GeneratedDiagram:
@@ -216,31 +308,54 @@ class RealDiagramClient:
         Returns:
             GeneratedDiagram model
         """
+        get = service_response.get
+        service_metadata = get("metadata") or {}
+
         return GeneratedDiagram(
-            type=service_response.get("diagram_type", original_request.get("diagram_type", "unknown")),
-            url=service_response.get("diagram_url", ""),
+            type=get("diagram_type", original_request.get("diagram_type", "unknown")),
+            url=get("diagram_url", ""),
             data=None,  # Optional structured data
             metadata={
-                "generation_method": service_response.get("generation_method"),
-                "generation_time_ms": service_response.get("metadata", {}).get("generation_time_ms"),
-                "dimensions": service_response.get("metadata", {}).get("dimensions"),
+                "generation_method": get("generation_method"),
+                "generation_time_ms": service_metadata.get("generation_time_ms"),
+                "dimensions": service_metadata.get("dimensions"),
                 "source": "diagram_service_v3.0"
             }
         )
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedDiagram]:
         """
         Generate batch of diagrams.
 
         Args:
             requests: List of request dicts
+            max_concurrency: Maximum requests in flight at once (default: DIAGRAM_MAX_CONCURRENCY)
 
         Returns:
-            List of GeneratedDiagram
+            List of GeneratedDiagram, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        return await run_batch(self.generate, requests, max_concurrency or self.max_concurrency)
+
+
+_diagram_client: Optional[RealDiagramClient] = None
+
+
+def get_diagram_client() -> RealDiagramClient:
+    """
+    Return the process-wide RealDiagramClient, creating it on first use.
+
+    Sharing one instance keeps its response cache, in-flight dedupe and
+    circuit breaker effective across every call site.
+
+    Returns:
+        Shared RealDiagramClient
+    """
+    global _diagram_client
+
+    if _diagram_client is None:
+        _diagram_client = RealDiagramClient()
+    return _diagram_client
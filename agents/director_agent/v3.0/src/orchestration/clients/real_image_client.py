@@ -15,15 +15,37 @@ Service Details:
 import os
 import asyncio
 import logging
-from typing import Dict, Any
-import requests
+from typing import Dict, Any, Optional
+import aiohttp
+import orjson
 from dotenv import load_dotenv
 
 from orchestration.models.director_models import GeneratedImage
+from orchestration.clients.http_session import get_shared_aiohttp_session
+from orchestration.clients.response_cache import ResponseCache, InflightRequests, request_cache_key
+from orchestration.clients.circuit_breaker import CircuitBreaker
+from orchestration.clients.batching import run_batch
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Service options sent when the request overrides none of them (read-only;
+# request dicts are only ever serialized)
+DEFAULT_IMAGE_OPTIONS = {"remove_background": False, "crop_anchor": "center", "store_in_cloud": True}
+
+# Default cap on concurrent requests from generate_batch (the service's sweet spot)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Maximum number of generated images memoized per client
+CACHE_MAX_ENTRIES = 512
+
+# Service settings, read from the environment once at import
+IMAGE_SERVICE_URL = os.getenv("IMAGE_SERVICE_URL", "https://web-production-1b5df.up.railway.app")
+IMAGE_SERVICE_TIMEOUT = int(os.getenv("IMAGE_SERVICE_TIMEOUT", "60"))
+IMAGE_MAX_CONCURRENCY = int(os.getenv("IMAGE_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+
 
 class RealImageClient:
     """
@@ -32,23 +54,44 @@ class RealImageClient:
     Integrates with production Railway deployment, replacing MockImageClient.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[int] = None
+    ):
         """
         Initialize image service client.
 
         Args:
             base_url: Override URL (default: from IMAGE_SERVICE_URL env var)
+            session: aiohttp session to use (default: the shared orchestration session)
+            timeout: Override request timeout in seconds (default: from IMAGE_SERVICE_TIMEOUT env var)
         """
-        self.base_url = base_url or os.getenv(
-            "IMAGE_SERVICE_URL",
-            "https://web-production-1b5df.up.railway.app"
-        )
+        self.base_url = base_url or IMAGE_SERVICE_URL
         self.api_base = f"{self.base_url}/api/v2"
-        self.timeout = int(os.getenv("IMAGE_SERVICE_TIMEOUT", "60"))
+        self._generate_url = f"{self.api_base}/generate"
+        self.timeout = timeout or IMAGE_SERVICE_TIMEOUT
+        self.max_concurrency = IMAGE_MAX_CONCURRENCY
+        self._request_timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        self._session = session
+
+        # LRU memo of completed images keyed by the normalized service request
+        self._cache: ResponseCache[GeneratedImage] = ResponseCache(CACHE_MAX_ENTRIES)
+        # Requests currently running, so concurrent duplicates share one service call
+        self._inflight: InflightRequests[GeneratedImage] = InflightRequests()
+
+        # Interned service options dicts for overridden options, keyed by
+        # (remove_background, crop_anchor); shared across requests and never mutated
+        self._options_pool: Dict[tuple, Dict[str, Any]] = {}
+
+        # Fail fast while the Image service is unreachable
+        self._breaker = CircuitBreaker("Image service")
 
         logger.info(f"RealImageClient initialized (url: {self.base_url}, timeout: {self.timeout}s)")
 
-    async def generate(self, request: Dict[str, Any]) -> GeneratedImage:
+    async def generate(self, request: Dict[str, Any], cache: bool = True) -> GeneratedImage:
         """
         Generate image from production service.
 
@@ -60,6 +103,7 @@ class RealImageClient:
                 - style: str - Image style/archetype
                 - dimensions: Dict - Width, height, aspect_ratio
                 - slide_number: int - For reference
+            cache: Reuse a previously generated result for an identical request
 
         Returns:
             GeneratedImage with URL and metadata
@@ -67,20 +111,40 @@ class RealImageClient:
         # Transform request to service format
         service_request = self._transform_request(request)
 
-        # Run synchronous HTTP request in executor (non-blocking)
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self._sync_generate_image,
-            service_request
-        )
+        key = request_cache_key(service_request)
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info(f"Image cache hit for slide {request.get('slide_number', '?')}")
+                return cached
+
+            # Join an identical request that is already running
+            if key in self._inflight:
+                logger.info(f"Image request for slide {request.get('slide_number', '?')} joined in-flight request")
+            return await self._inflight.run(key, lambda: self._generate_uncached(key, service_request, request))
+
+        return await self._generate_uncached(key, service_request, request)
+
+    async def _generate_uncached(self, key: str, service_request: Dict, request: Dict[str, Any]) -> GeneratedImage:
+        """Call the service and transform the result, memoizing it."""
+        # Call the service (synchronous API, 7-12s)
+        with self._breaker.guard():
+            response = await self._generate_image(service_request)
 
         # Transform response to orchestrator format
-        return self._transform_response(response, request)
+        image = self._transform_response(response, request)
+        self._cache.put(key, image)
+        return image
 
-    def _sync_generate_image(self, request: Dict) -> Dict:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session, or the process-wide shared one."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_shared_aiohttp_session()
+
+    async def _generate_image(self, request: Dict) -> Dict:
         """
-        Synchronous HTTP request to Image service.
+        HTTP request to Image service.
 
         Args:
             request: Service-formatted request
@@ -89,25 +153,25 @@ class RealImageClient:
             Service response dict
 
         Raises:
-            requests.HTTPError: On API errors
-            requests.Timeout: On timeout
+            aiohttp.ClientResponseError: On API errors
+            asyncio.TimeoutError: On timeout
         """
-        endpoint = f"{self.api_base}/generate"
-
         try:
-            response = requests.post(
-                endpoint,
-                json=request,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
-
-        except requests.Timeout as e:
+            async with self._get_session().post(
+                self._generate_url,
+                data=orjson.dumps(request, option=orjson.OPT_NON_STR_KEYS),
+                headers=JSON_HEADERS,
+                timeout=self._request_timeout
+            ) as response:
+                if response.status >= 400:
+                    logger.error(f"Image service HTTP error: {response.status} - {await response.text()}")
+                    response.raise_for_status()
+                return orjson.loads(await response.read())
+
+        except asyncio.TimeoutError:
             logger.error(f"Image service timeout after {self.timeout}s")
             raise
-        except requests.HTTPError as e:
-            logger.error(f"Image service HTTP error: {e.response.status_code} - {e.response.text}")
+        except aiohttp.ClientResponseError:
             raise
         except Exception as e:
             logger.error(f"Image service request failed: {str(e)}")
@@ -129,25 +193,37 @@ class RealImageClient:
             }
         }
         """
+        get = orchestrator_request.get
+
         # Extract prompt from goal or content
-        prompt = orchestrator_request.get("goal") or orchestrator_request.get("content", "")
+        prompt = get("goal") or get("content", "")
 
         # Extract aspect ratio from dimensions
-        dimensions = orchestrator_request.get("dimensions", {})
+        dimensions = get("dimensions") or {}
         aspect_ratio = dimensions.get("aspect_ratio", "16:9")
 
         # Extract style/archetype
-        style = orchestrator_request.get("style", "spot_illustration")
+        style = get("style", "spot_illustration")
+
+        # Options (the orchestrator normally overrides none)
+        if "remove_background" in orchestrator_request or "crop_anchor" in orchestrator_request:
+            remove_background = get("remove_background", False)
+            crop_anchor = get("crop_anchor", "center")
+            options = self._options_pool.get((remove_background, crop_anchor))
+            if options is None:
+                options = self._options_pool[(remove_background, crop_anchor)] = {
+                    "remove_background": remove_background,
+                    "crop_anchor": crop_anchor,
+                    "store_in_cloud": True
+                }
+        else:
+            options = DEFAULT_IMAGE_OPTIONS
 
         return {
             "prompt": prompt,
             "aspect_ratio": aspect_ratio,
             "archetype": style,
-            "options": {
-                "remove_background": orchestrator_request.get("remove_background", False),
-                "crop_anchor": orchestrator_request.get("crop_anchor", "center"),
-                "store_in_cloud": True
-            }
+            "options": options
         }
 
     def _transform_response(self, service_response: Dict, original_request: Dict) -> GeneratedImage:
@@ -174,8 +250,10 @@ class RealImageClient:
         Returns:
             GeneratedImage model
         """
+        service_metadata = service_response.get("metadata") or {}
+
         # Use cropped URL if available, otherwise original
-        urls = service_response.get("urls", {})
+        urls = service_response.get("urls") or {}
         image_url = urls.get("cropped") or urls.get("original", "")
 
         # Generate caption from original request
@@ -186,9 +264,9 @@ class RealImageClient:
             caption=caption,
             metadata={
                 "image_id": service_response.get("image_id"),
-                "aspect_ratio": service_response["metadata"].get("target_aspect_ratio"),
-                "generation_time_ms": service_response["metadata"].get("generation_time_ms"),
-                "model": service_response["metadata"].get("model"),
+                "aspect_ratio": service_metadata.get("target_aspect_ratio"),
+                "generation_time_ms": service_metadata.get("generation_time_ms"),
+                "model": service_metadata.get("model"),
                 "all_urls": urls,
                 "source": "image_service_v2.0"
             }
@@ -196,17 +274,37 @@ class RealImageClient:
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[GeneratedImage]:
         """
         Generate batch of images.
 
         Args:
             requests: List of request dicts
+            max_concurrency: Maximum requests in flight at once (default: IMAGE_MAX_CONCURRENCY)
 
         Returns:
-            List of GeneratedImage
+            List of GeneratedImage, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        return await run_batch(self.generate, requests, max_concurrency or self.max_concurrency)
+
+
+_image_client: Optional[RealImageClient] = None
+
+
+def get_image_client() -> RealImageClient:
+    """
+    Return the process-wide RealImageClient, creating it on first use.
+
+    Sharing one instance keeps its response cache, in-flight dedupe and
+    circuit breaker effective across every call site.
+
+    Returns:
+        Shared RealImageClient
+    """
+    global _image_client
+
+    if _image_client is None:
+        _image_client = RealImageClient()
+    return _image_client
@@ -14,15 +14,20 @@ Service Details:
 import os
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import requests
+import orjson
 from dotenv import load_dotenv
 
 from orchestration.models.director_models import GeneratedText
+from orchestration.clients.circuit_breaker import CircuitBreaker
+from orchestration.clients.batching import run_batch, DEFAULT_BATCH_CONCURRENCY
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
 
 class RealTextClient:
     """
@@ -31,20 +36,29 @@ class RealTextClient:
     Integrates with production Railway deployment, replacing MockTextClient.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, session: requests.Session = None):
         """
         Initialize text service client.
 
         Args:
             base_url: Override URL (default: from TEXT_SERVICE_URL env var)
+            session: Shared HTTP session (connection pool); a private one is created if omitted
         """
         self.base_url = base_url or os.getenv(
             "TEXT_SERVICE_URL",
             "https://web-production-e3796.up.railway.app"
         )
         self.api_base = f"{self.base_url}/api/v1"
+        self._generate_url = f"{self.api_base}/generate/text"
         self.timeout = int(os.getenv("TEXT_SERVICE_TIMEOUT", "60"))
 
+        # Close the session on aclose() only if we created it
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+
+        # Fail fast while the Text service is unreachable
+        self._breaker = CircuitBreaker("Text service")
+
         logger.info(f"RealTextClient initialized (url: {self.base_url}, timeout: {self.timeout}s)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedText:
@@ -69,16 +83,22 @@ class RealTextClient:
         service_request = self._transform_request(request)
 
         # Run synchronous HTTP request in executor (non-blocking)
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self._sync_generate_text,
-            service_request
-        )
+        loop = asyncio.get_running_loop()
+        with self._breaker.guard():
+            response = await loop.run_in_executor(
+                None,
+                self._sync_generate_text,
+                service_request
+            )
 
         # Transform response to orchestrator format
         return self._transform_response(response)
 
+    async def aclose(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_session:
+            self.session.close()
+
     def _sync_generate_text(self, request: Dict) -> Dict:
         """
         Synchronous HTTP request to Text service.
@@ -93,16 +113,15 @@ class RealTextClient:
             requests.HTTPError: On API errors
             requests.Timeout: On timeout
         """
-        endpoint = f"{self.api_base}/generate/text"
-
         try:
-            response = requests.post(
-                endpoint,
-                json=request,
+            response = self.session.post(
+                self._generate_url,
+                data=orjson.dumps(request, option=orjson.OPT_NON_STR_KEYS),
+                headers=JSON_HEADERS,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except requests.Timeout as e:
             logger.error(f"Text service timeout after {self.timeout}s")
@@ -186,17 +205,17 @@ class RealTextClient:
 
     async def generate_batch(
         self,
-        requests: list[Dict[str, Any]]
+        requests: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = DEFAULT_BATCH_CONCURRENCY
     ) -> list[GeneratedText]:
         """
         Generate batch of texts.
 
         Args:
             requests: List of request dicts
+            max_concurrency: Maximum requests in flight at once (default 32)
 
         Returns:
-            List of GeneratedText
+            List of GeneratedText, in request order
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
-        return results
+        return await run_batch(self.generate, requests, max_concurrency)
@@ -0,0 +1,104 @@
+"""
+Response Cache
+==============
+
+Content-addressed request deduplication shared by the real service clients.
+Results are keyed by a hash of the normalized service request, so an
+identical chart, diagram or image request is answered in-process instead of
+round-tripping to the service again:
+
+- ResponseCache: LRU memo of completed results
+- InflightRequests: running requests, so concurrent duplicates share one
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def request_cache_key(service_request: Dict[str, Any]) -> str:
+    """Stable content hash of a service-formatted request."""
+    payload = orjson.dumps(service_request, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class ResponseCache(Generic[M]):
+    """
+    Bounded LRU of generated models.
+
+    Entries are deep-copied on the way in and out so callers can never
+    mutate a cached result.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, M]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[M]:
+        """Return a copy of the cached model (marking it recently used), or None."""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        self._entries.move_to_end(key)
+        return cached.model_copy(deep=True)
+
+    def put(self, key: str, value: M) -> None:
+        """Store a private copy of value, evicting the least recently used entry."""
+        self._entries[key] = value.model_copy(deep=True)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InflightRequests(Generic[M]):
+    """
+    Registry of requests currently running, keyed like ResponseCache.
+
+    The lookup and insert in run() happen without an intervening await, so
+    no lock is needed on the single-threaded event loop.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._tasks: Dict[str, "asyncio.Task[M]"] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tasks
+
+    async def run(self, key: str, start: Callable[[], Awaitable[M]]) -> M:
+        """
+        Join the running request for key, or start it with start().
+
+        The shared task is awaited through asyncio.shield, so one cancelled
+        caller does not cancel the request for the others; every caller gets
+        its own deep copy of the result (or the same exception).
+
+        Args:
+            key: Request cache key
+            start: Zero-argument coroutine function performing the request
+
+        Returns:
+            Copy of the request's result
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(start())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _task: self._tasks.pop(key, None))
+        result = await asyncio.shield(task)
+        return result.model_copy(deep=True)
@@ -8,7 +8,7 @@ Based on content_orchestrator_integration.md and content_orchestrator_sla.md spe
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .agents import Slide, PresentationStrawman
 from .layout_models import ValidationStatus, ValidationReport
 
@@ -21,6 +21,8 @@ class GeneratedText(BaseModel):
     Input topic: "Q3 revenue growth"
     Output: GeneratedText(content="Q3 revenue reached $127M, up 32% from Q2")
     """
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(description="The actual generated text")
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
@@ -34,6 +36,8 @@ class GeneratedImage(BaseModel):
 
     Director expects actual image URLs, not specifications.
     """
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field(description="URL to the generated image")
     caption: Optional[str] = Field(
         default=None,
@@ -51,6 +55,8 @@ class GeneratedChart(BaseModel):
 
     Must include both rendered chart URL and structured data.
     """
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(
         description="Chart type: 'bar', 'line', 'pie', 'area', etc."
     )
@@ -73,6 +79,8 @@ class GeneratedDiagram(BaseModel):
 
     Director expects actual diagram URLs (SVG, PNG, etc.).
     """
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(
         description="Diagram type: 'flowchart', 'hierarchy', 'process', etc."
     )
@@ -96,6 +104,8 @@ class EnrichedSlide(BaseModel):
     - generated_content: Dict with actual content (text, images, charts, diagrams)
     - validation_status: Validation against layout constraints
     """
+    model_config = ConfigDict(frozen=True)
+
     original_slide: Slide = Field(
         description="The full input slide from strawman"
     )
@@ -107,12 +117,12 @@ class EnrichedSlide(BaseModel):
     )
     generated_content: Dict[str, Any] = Field(
         description="Actual generated content",
-        example={
+        examples=[{
             "text": "GeneratedText object or None",
             "images": "[GeneratedImage objects] or []",
             "charts": "[GeneratedChart objects] or []",
             "diagrams": "[GeneratedDiagram objects] or []"
-        }
+        }]
     )
     validation_status: ValidationStatus = Field(
         description="Validation status against layout constraints"
@@ -129,6 +139,8 @@ class EnrichedPresentationStrawman(BaseModel):
     - validation_report: Overall validation status
     - generation_metadata: Stats about generation process
     """
+    model_config = ConfigDict(frozen=True)
+
     original_strawman: PresentationStrawman = Field(
         description="The full input strawman from Director"
     )
@@ -141,7 +153,7 @@ class EnrichedPresentationStrawman(BaseModel):
     generation_metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Metadata about generation process",
-        example={
+        examples=[{
             "total_items_generated": 12,
             "successful_items": 11,
             "failed_items": 1,
@@ -150,7 +162,7 @@ class EnrichedPresentationStrawman(BaseModel):
             "failures": [
                 {"slide": 5, "type": "image", "error": "API timeout"}
             ]
-        }
+        }]
     )
 
 
@@ -163,7 +175,7 @@ class ContentGenerationError(BaseModel):
     slide_number: int = Field(description="Slide where error occurred")
     component_type: str = Field(
         description="Component type that failed",
-        example="text, analytics, image, diagram, table"
+        examples=["text, analytics, image, diagram, table"]
     )
     error_message: str = Field(description="Error details")
     recoverable: bool = Field(
@@ -7,11 +7,13 @@ Based on content_orchestrator_sla.md specification.
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ImageDimensions(BaseModel):
     """Required dimensions for images/charts in a layout."""
+    model_config = ConfigDict(frozen=True)
+
     width: int = Field(description="Required width in pixels")
     height: int = Field(description="Required height in pixels")
     aspect_ratio: str = Field(description="Aspect ratio like '16:9', '4:3', '2:1'")
@@ -33,16 +35,18 @@ class LayoutConstraints(BaseModel):
     - Images MUST match aspect ratio within tolerance
     - All required fields MUST be present
     """
+    model_config = ConfigDict(frozen=True)
+
     # Required fields for this layout
     required_fields: List[str] = Field(
         description="List of required field names",
-        example=["slide_title", "chart_url", "key_insights"]
+        examples=[["slide_title", "chart_url", "key_insights"]]
     )
 
     # Character limits per field
     character_limits: Dict[str, int] = Field(
         description="Maximum characters per text field",
-        example={"slide_title": 80, "subtitle": 80, "summary": 200}
+        examples=[{"slide_title": 80, "subtitle": 80, "summary": 200}]
     )
 
     # Image/chart dimensions
@@ -55,14 +59,14 @@ class LayoutConstraints(BaseModel):
     array_limits: Dict[str, int] = Field(
         default_factory=dict,
         description="Maximum items per array field",
-        example={"bullets": 8, "key_insights": 6}
+        examples=[{"bullets": 8, "key_insights": 6}]
     )
 
     # Array item character limits
     array_item_limits: Dict[str, int] = Field(
         default_factory=dict,
         description="Maximum characters per array item",
-        example={"bullets_item": 60, "key_insights_item": 80}
+        examples=[{"bullets_item": 60, "key_insights_item": 80}]
     )
 
 
@@ -84,21 +88,25 @@ class LayoutAssignment(BaseModel):
 
 class ValidationViolation(BaseModel):
     """A single constraint violation found during validation."""
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(description="Field name that violated constraint")
     constraint: str = Field(
         description="Type of constraint violated",
-        example="character_limit, array_limit, required, dimensions"
+        examples=["character_limit, array_limit, required, dimensions"]
     )
     expected: str = Field(description="Expected value/constraint")
     actual: Any = Field(description="Actual value found")
     severity: str = Field(
         description="Severity level: 'critical' or 'warning'",
-        example="critical"
+        examples=["critical"]
     )
 
 
 class ValidationStatus(BaseModel):
     """Validation status for a single slide."""
+    model_config = ConfigDict(frozen=True)
+
     compliant: bool = Field(
         description="Whether slide meets all constraints"
     )
@@ -132,9 +140,9 @@ class LayoutSpecification(BaseModel):
     description: str = Field(description="Layout description")
     content_fields: Dict[str, Dict[str, Any]] = Field(
         description="Field definitions with type and constraints",
-        example={
+        examples=[{
             "slide_title": {"type": "text", "max_length": 80},
             "chart_url": {"type": "image", "dimensions": "800x400"},
             "key_insights": {"type": "array", "max_items": 6, "item_max_length": 80}
-        }
+        }]
     )
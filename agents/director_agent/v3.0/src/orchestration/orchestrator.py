@@ -26,22 +26,70 @@ Architecture:
 
 import logging
 import time
-from typing import Optional, Callable, List, Dict, Any
-from datetime import datetime
+from typing import Optional, Callable, List, Dict, Any, Tuple
+from datetime import datetime, timezone
 
 # Import v2 models - use absolute imports for production
 from orchestration.models.agents import PresentationStrawman, Slide
 from orchestration.models.layout_models import LayoutAssignment, LayoutConstraints, ValidationReport
-from orchestration.models.director_models import EnrichedPresentationStrawman
+from orchestration.models.director_models import EnrichedPresentationStrawman, EnrichedSlide
 
 # Import v2 services - use absolute imports for production
 from orchestration.services.request_builder import RequestBuilder
-from orchestration.services.api_dispatcher import APIDispatcher
-from orchestration.services.result_stitcher import ResultStitcher
+from orchestration.services.api_dispatcher import APIDispatcher, DEFAULT_MAX_CONCURRENCY
+from orchestration.services.result_stitcher import ResultStitcher, EMPTY_API_RESULTS
 from orchestration.services.sla_validator import SLAValidator
 
 logger = logging.getLogger(__name__)
 
+# Default layouts for test mode: layout_id -> (layout_name, constraints).
+# LayoutConstraints is frozen, so every assignment shares these instances.
+_DEFAULT_LAYOUTS = {
+    "L01": ("Title Slide", LayoutConstraints(
+        required_fields=["main_title", "subtitle"],
+        character_limits={"main_title": 80, "subtitle": 120},
+        array_limits={},
+        array_item_limits={}
+    )),
+    "L17": ("Chart + Insights", LayoutConstraints(
+        required_fields=["slide_title", "chart_url", "key_insights"],
+        character_limits={"slide_title": 80, "summary": 200},
+        array_limits={"key_insights": 6},
+        array_item_limits={"key_insights_item": 80}
+    )),
+    "L10": ("Image + Text", LayoutConstraints(
+        required_fields=["slide_title", "image_url"],
+        character_limits={"slide_title": 80, "body_text": 300},
+        array_limits={},
+        array_item_limits={}
+    )),
+    "L05": ("Bullet List", LayoutConstraints(
+        required_fields=["slide_title", "bullets"],
+        character_limits={"slide_title": 80},
+        array_limits={"bullets": 8},
+        array_item_limits={"bullets_item": 60}
+    )),
+}
+
+
+# Default layout by (slide_type, has analytics_needed, has visuals_needed);
+# anything not listed gets the bullet list (L05)
+_LAYOUT_RULES = {
+    **{("title_slide", analytics, visuals): "L01"
+       for analytics in (False, True) for visuals in (False, True)},
+    **{(slide_type, True, visuals): "L17"
+       for slide_type in ("data_driven", "content_heavy") for visuals in (False, True)},
+    **{("visual_heavy", analytics, True): "L10" for analytics in (False, True)},
+}
+
+
+def _classify_slide(slide: Slide) -> str:
+    """Pick the default layout ID for a slide based on its type."""
+    return _LAYOUT_RULES.get(
+        (slide.slide_type, bool(slide.analytics_needed), bool(slide.visuals_needed)),
+        "L05"
+    )
+
 
 class ContentOrchestratorV2:
     """
@@ -56,7 +104,15 @@ class ContentOrchestratorV2:
     4. Minimal validation (trust but verify)
     """
 
-    def __init__(self, text_client, chart_client, image_client, diagram_client):
+    def __init__(
+        self,
+        text_client,
+        chart_client,
+        image_client,
+        diagram_client,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        include_failure_details: bool = True
+    ):
         """
         Initialize v2.0 orchestrator with API clients.
 
@@ -65,16 +121,21 @@ class ContentOrchestratorV2:
             chart_client: Chart generation API client
             image_client: Image generation API client
             diagram_client: Diagram generation API client
+            max_concurrency: Maximum number of in-flight API calls
+            include_failure_details: List each failure in generation_metadata
+                (False keeps only the failed_items count)
         """
         self.request_builder = RequestBuilder()
         self.api_dispatcher = APIDispatcher(
             text_client=text_client,
             chart_client=chart_client,
             image_client=image_client,
-            diagram_client=diagram_client
+            diagram_client=diagram_client,
+            max_concurrency=max_concurrency
         )
         self.result_stitcher = ResultStitcher()
         self.sla_validator = SLAValidator()
+        self.include_failure_details = include_failure_details
 
         logger.info("ContentOrchestratorV2 initialized (lightweight mode)")
 
@@ -99,7 +160,8 @@ class ContentOrchestratorV2:
         Returns:
             EnrichedPresentationStrawman with generated content
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        start_wall = time.time()
         logger.info(f"Starting v2.0 presentation enrichment: '{strawman.main_title}'")
 
         # Create default layout assignments if not provided
@@ -132,50 +194,41 @@ class ContentOrchestratorV2:
         if progress_callback:
             progress_callback(f"Calling {total_requests} APIs in parallel", 2, 5)
 
+        # Validate and stitch each slide as soon as its last API call
+        # finishes, so this work overlaps with slower slides still in flight
+        slides_by_id = {
+            slide.slide_id: (slide, layout_assignment)
+            for slide, layout_assignment in zip(strawman.slides, layout_assignments)
+        }
+        enriched_by_id: Dict[str, EnrichedSlide] = {}
+
+        def enrich_ready_slide(slide_id: str, results: Dict[str, Any]) -> None:
+            entry = slides_by_id.get(slide_id)
+            if entry is not None:
+                enriched_by_id[slide_id] = self._enrich_slide(*entry, results)
+
         api_results = await self.api_dispatcher.dispatch_all(
             all_requests=all_requests,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            slide_callback=enrich_ready_slide
         )
 
         logger.info(f"All API calls completed, got results for {len(api_results)} slides")
 
-        # Step 3: Validate results (minimal validation)
+        # Steps 3-4: Collect the slides stitched during dispatch, in deck
+        # order, and validate and stitch the slides that had no API calls
         if progress_callback:
-            progress_callback("Validating results", 3, 5)
-
-        # Map API results to content dicts for validation
-        all_content = {}
-        for slide_id, results in api_results.items():
-            # Get the slide and layout for this slide_id
-            slide = next((s for s in strawman.slides if s.slide_id == slide_id), None)
-            layout = next((la for la in layout_assignments if la.slide_id == slide_id), None)
-
-            if slide and layout:
-                # Map to layout-specific fields
-                mapped_content = self.result_stitcher._map_to_layout(
-                    slide=slide,
-                    api_results=results,
-                    layout_id=layout.layout_id
-                )
-                all_content[slide_id] = mapped_content
-
-        validation_results = self.sla_validator.validate_batch(
-            all_content=all_content,
-            layout_assignments=layout_assignments
-        )
+            progress_callback("Validating and stitching results", 3, 5)
 
-        logger.info(f"Validation complete for {len(validation_results)} slides")
+        enriched_slides = []
+        for slide, layout_assignment in zip(strawman.slides, layout_assignments):
+            enriched_slide = enriched_by_id.get(slide.slide_id)
+            if enriched_slide is None:
+                enriched_slide = self._enrich_slide(slide, layout_assignment, None)
+            enriched_slides.append(enriched_slide)
 
-        # Step 4: Stitch results into EnrichedSlides
         if progress_callback:
-            progress_callback("Stitching results", 4, 5)
-
-        enriched_slides = self.result_stitcher.stitch_batch(
-            slides=strawman.slides,
-            layout_assignments=layout_assignments,
-            all_api_results=api_results,
-            all_validation_statuses=validation_results
-        )
+            progress_callback(f"Stitched {len(enriched_slides)} slides", 4, 5)
 
         logger.info(f"Stitched {len(enriched_slides)} enriched slides")
 
@@ -183,17 +236,18 @@ class ContentOrchestratorV2:
         if progress_callback:
             progress_callback("Creating final report", 5, 5)
 
-        validation_report = self._create_validation_report(enriched_slides)
-
-        processing_time = time.time() - start_time
-        generation_metadata = self._create_generation_metadata(
+        processing_time = time.monotonic() - start_time
+        validation_report, generation_metadata = self._create_final_reports(
+            enriched_slides=enriched_slides,
             api_results=api_results,
             processing_time=processing_time,
-            total_requests=total_requests
+            total_requests=total_requests,
+            start_wall=start_wall
         )
 
-        # Return Director-compliant structure
-        enriched_strawman = EnrichedPresentationStrawman(
+        # Return Director-compliant structure (assembled from already
+        # validated models, so skip re-validation)
+        enriched_strawman = EnrichedPresentationStrawman.model_construct(
             original_strawman=strawman,
             enriched_slides=enriched_slides,
             validation_report=validation_report,
@@ -207,6 +261,10 @@ class ContentOrchestratorV2:
 
         return enriched_strawman
 
+    async def aclose(self) -> None:
+        """Release connection pools owned by the API clients."""
+        await self.api_dispatcher.aclose()
+
     def _build_all_requests(
         self,
         strawman: PresentationStrawman,
@@ -248,74 +306,125 @@ class ContentOrchestratorV2:
 
         return all_requests
 
-    def _create_validation_report(self, enriched_slides: List[Any]) -> ValidationReport:
-        """Create overall validation report."""
-        total_slides = len(enriched_slides)
-        compliant_slides = sum(
-            1 for slide in enriched_slides if slide.validation_status.compliant
-        )
+    def _enrich_slide(
+        self,
+        slide: Slide,
+        layout_assignment: LayoutAssignment,
+        results: Optional[Dict[str, Any]]
+    ) -> EnrichedSlide:
+        """
+        Validate and stitch one slide, mapping its results to layout fields
+        once for both.
 
-        total_violations = sum(
-            len(slide.validation_status.violations) for slide in enriched_slides
-        )
+        Args:
+            slide: Slide from the strawman
+            layout_assignment: Layout assignment for this slide
+            results: The slide's grouped API results (None if it had no API calls)
 
-        critical_violations = sum(
-            len([v for v in slide.validation_status.violations if v.severity == "critical"])
-            for slide in enriched_slides
+        Returns:
+            EnrichedSlide
+        """
+        if results is None:
+            # No API calls for this slide: validate as empty content
+            results = EMPTY_API_RESULTS
+            mapped_content = None
+        else:
+            mapped_content = self.result_stitcher._map_to_layout(
+                slide=slide,
+                api_results=results,
+                layout_id=layout_assignment.layout_id
+            )
+
+        validation_status = self.sla_validator.validate_slide(
+            content=mapped_content or {},
+            constraints=layout_assignment.constraints,
+            slide_id=layout_assignment.slide_id
         )
 
-        return ValidationReport(
-            overall_compliant=(critical_violations == 0),
-            total_slides=total_slides,
-            compliant_slides=compliant_slides,
-            total_violations=total_violations,
-            critical_violations=critical_violations
+        return self.result_stitcher.stitch_slide(
+            slide=slide,
+            layout_assignment=layout_assignment,
+            api_results=results,
+            validation_status=validation_status,
+            mapped_content=mapped_content
         )
 
-    def _create_generation_metadata(
+    def _create_final_reports(
         self,
+        enriched_slides: List[Any],
         api_results: Dict[str, Any],
         processing_time: float,
-        total_requests: int
-    ) -> Dict[str, Any]:
-        """Create generation metadata."""
+        total_requests: int,
+        start_wall: float
+    ) -> Tuple[ValidationReport, Dict[str, Any]]:
+        """
+        Create the validation report and generation metadata in one pass.
+
+        The timestamp is the UTC completion time, derived from the wall-clock
+        start and the monotonic processing time.
+
+        Returns:
+            (ValidationReport, generation metadata dict)
+        """
+        compliant_slides = 0
+        total_violations = 0
+        critical_violations = 0
         successful_items = 0
         failed_items = 0
         failures = []
+        include_failure_details = self.include_failure_details
+
+        for slide in enriched_slides:
+            # Validation counts
+            status = slide.validation_status
+            compliant_slides += status.compliant
+            total_violations += len(status.violations)
+            critical_violations += sum(v.severity == "critical" for v in status.violations)
+
+            # Generation counts
+            results = api_results.get(slide.slide_id)
+            if not results:
+                continue
+            get = results.get
+
+            successful_items += (
+                bool(get("text"))
+                + len(get("charts") or ())
+                + len(get("images") or ())
+                + len(get("diagrams") or ())
+            )
+
+            errors = get("errors")
+            if errors:
+                failed_items += len(errors)
+                if include_failure_details:
+                    failures.extend(
+                        {"slide": slide.slide_id, "type": error.get("api_type"), "error": error.get("error")}
+                        for error in errors
+                    )
+
+        validation_report = ValidationReport(
+            overall_compliant=(critical_violations == 0),
+            total_slides=len(enriched_slides),
+            compliant_slides=compliant_slides,
+            total_violations=total_violations,
+            critical_violations=critical_violations
+        )
 
-        for slide_id, results in api_results.items():
-            # Count successes
-            if results.get("text"):
-                successful_items += 1
-            if results.get("charts"):
-                successful_items += len(results["charts"])
-            if results.get("images"):
-                successful_items += len(results["images"])
-            if results.get("diagrams"):
-                successful_items += len(results["diagrams"])
-
-            # Count failures
-            if results.get("errors"):
-                failed_items += len(results["errors"])
-                for error in results["errors"]:
-                    failures.append({
-                        "slide": slide_id,
-                        "type": error.get("api_type"),
-                        "error": error.get("error")
-                    })
-
-        return {
+        generation_metadata = {
             "total_items_generated": successful_items + failed_items,
             "successful_items": successful_items,
             "failed_items": failed_items,
             "generation_time_seconds": round(processing_time, 2),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(start_wall + processing_time, tz=timezone.utc).isoformat(timespec="milliseconds"),
             "failures": failures,
             "orchestrator_version": "2.0",
             "architecture": "lightweight",
             "total_api_requests": total_requests
         }
 
+        return validation_report, generation_metadata
+
     def _create_default_layout_assignments(
         self,
         strawman: PresentationStrawman
@@ -330,43 +439,8 @@ class ContentOrchestratorV2:
         default_assignments = []
 
         for slide in strawman.slides:
-            # Determine layout based on slide type
-            if slide.slide_type == "title_slide":
-                layout_id = "L01"
-                layout_name = "Title Slide"
-                constraints = LayoutConstraints(
-                    required_fields=["main_title", "subtitle"],
-                    character_limits={"main_title": 80, "subtitle": 120},
-                    array_limits={},
-                    array_item_limits={}
-                )
-            elif slide.slide_type in ["data_driven", "content_heavy"] and slide.analytics_needed:
-                layout_id = "L17"
-                layout_name = "Chart + Insights"
-                constraints = LayoutConstraints(
-                    required_fields=["slide_title", "chart_url", "key_insights"],
-                    character_limits={"slide_title": 80, "summary": 200},
-                    array_limits={"key_insights": 6},
-                    array_item_limits={"key_insights_item": 80}
-                )
-            elif slide.slide_type == "visual_heavy" and slide.visuals_needed:
-                layout_id = "L10"
-                layout_name = "Image + Text"
-                constraints = LayoutConstraints(
-                    required_fields=["slide_title", "image_url"],
-                    character_limits={"slide_title": 80, "body_text": 300},
-                    array_limits={},
-                    array_item_limits={}
-                )
-            else:
-                layout_id = "L05"
-                layout_name = "Bullet List"
-                constraints = LayoutConstraints(
-                    required_fields=["slide_title", "bullets"],
-                    character_limits={"slide_title": 80},
-                    array_limits={"bullets": 8},
-                    array_item_limits={"bullets_item": 60}
-                )
+            layout_id = _classify_slide(slide)
+            layout_name, constraints = _DEFAULT_LAYOUTS[layout_id]
 
             assignment = LayoutAssignment(
                 slide_id=slide.slide_id,
@@ -4,33 +4,118 @@ API Dispatcher - v2.0
 
 Parallel API execution with progress streaming.
 
-This service orchestrates parallel API calls using asyncio.gather().
-All APIs are called simultaneously for maximum performance.
+This service orchestrates parallel API calls in an asyncio.TaskGroup.
+All APIs are called concurrently, capped per API type (and overall) by
+semaphores so large decks don't exceed provider rate limits.
 
 Performance target: <10s for 10 slides (all APIs in parallel)
 """
 
 import asyncio
 import logging
+import random
 import time
 from typing import Dict, List, Any, Optional, Callable
-from datetime import datetime
+
+import aiohttp
+import requests
 
 logger = logging.getLogger(__name__)
 
+# Default cap on simultaneous API calls, to stay within provider rate limits
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Default per-API caps on simultaneous calls, sized to each provider, so one
+# throttled provider can't hold every slot
+DEFAULT_API_CONCURRENCY = {"text": 32, "chart": 8, "image": 4, "diagram": 8}
+
+# Retry policy for transient API failures: total attempts per request, and
+# the base delay (s) of the exponential backoff between them
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.25
+
+# HTTP statuses worth retrying (timeouts, rate limits, gateway/server errors)
+TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Minimum seconds between forwarded progress updates while dispatching
+PROGRESS_INTERVAL = 0.1
+
+# Per-slide result list each list-valued API type is appended to
+_APPEND_FIELD = {"chart": "charts", "image": "images", "diagram": "diagrams"}
+
+
+def _new_slide_entry() -> Dict[str, Any]:
+    """Empty per-slide results entry."""
+    return {"text": None, "charts": [], "images": [], "diagrams": [], "errors": []}
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether an API client error is worth retrying.
+
+    Retries connection failures and retryable HTTP statuses from both the
+    aiohttp (ClientResponseError.status) and requests
+    (HTTPError.response.status_code) clients. Timeouts are not retried: the
+    clients' own timeouts already span the slide's time budget. Other
+    client errors (bad requests, malformed responses) are not retried either.
+
+    Note requests.RequestException subclasses OSError, so requests errors
+    are classified before the generic OSError fallback.
+    """
+    if isinstance(error, (TimeoutError, requests.Timeout)):
+        return False
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in TRANSIENT_STATUSES
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in TRANSIENT_STATUSES
+    if isinstance(error, requests.RequestException):
+        return isinstance(error, requests.ConnectionError)
+    return isinstance(error, (aiohttp.ClientConnectionError, OSError))
+
+
+class _ThrottledCallback:
+    """
+    Progress callback wrapper forwarding at most one update per interval.
+
+    Final updates (current == total) are always forwarded, so callers still
+    see completion.
+    """
+
+    def __init__(self, callback: Callable[[str, int, int], None], interval: float = PROGRESS_INTERVAL):
+        self.callback = callback
+        self.interval = interval
+        self._last = float("-inf")
+
+    def __call__(self, message: str, current: int, total: int) -> None:
+        now = time.monotonic()
+        if current == total or now - self._last >= self.interval:
+            self._last = now
+            self.callback(message, current, total)
+
 
 class APIDispatcher:
     """
     Dispatches API requests in parallel with progress streaming.
 
     Key features:
-    - Parallel execution using asyncio.gather()
+    - Parallel execution using asyncio.TaskGroup
     - Real-time progress callbacks
     - Error handling with partial results
     - Automatic retry on transient failures
     """
 
-    def __init__(self, text_client, chart_client, image_client, diagram_client):
+    def __init__(
+        self,
+        text_client,
+        chart_client,
+        image_client,
+        diagram_client,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        api_concurrency: Optional[Dict[str, int]] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    ):
         """
         Initialize dispatcher with API clients.
 
@@ -39,22 +124,72 @@ class APIDispatcher:
             chart_client: Chart generation API client
             image_client: Image generation API client
             diagram_client: Diagram generation API client
+            max_concurrency: Maximum number of in-flight API calls (rate-limit guard)
+            api_concurrency: Per-API-type caps overriding DEFAULT_API_CONCURRENCY
+            max_attempts: Attempts per request on transient failures (1 = no retry)
+            retry_backoff: Base delay in seconds, doubled after each failed attempt
         """
         self.text_client = text_client
         self.chart_client = chart_client
         self.image_client = image_client
         self.diagram_client = diagram_client
-        logger.info("APIDispatcher initialized with 4 API clients")
+        self.max_concurrency = max_concurrency
+        self.api_concurrency = {**DEFAULT_API_CONCURRENCY, **(api_concurrency or {})}
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+
+        self._clients = {
+            "text": text_client,
+            "chart": chart_client,
+            "image": image_client,
+            "diagram": diagram_client
+        }
+
+        # A call takes its API-type slot first, then an overall slot, so calls
+        # queued behind a throttled provider never hold overall slots
+        self._api_semaphores = {
+            api_type: asyncio.Semaphore(limit)
+            for api_type, limit in self.api_concurrency.items()
+        }
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        logger.info(
+            f"APIDispatcher initialized with 4 API clients "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+    async def __aenter__(self) -> "APIDispatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Release connection pools owned by the API clients.
+
+        Clients opt in by defining an async aclose(); clients on the shared
+        aiohttp session own no pool of their own and are left alone, so the
+        shared pool survives until the host closes it.
+        """
+        clients = (self.text_client, self.chart_client, self.image_client, self.diagram_client)
+        for client in dict.fromkeys(clients):
+            close = getattr(client, "aclose", None)
+            if close is not None:
+                await close()
 
     async def dispatch_all(
         self,
         all_requests: Dict[str, List[Dict[str, Any]]],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        slide_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Dispatch all API requests in parallel.
 
-        This is the main entry point for parallel execution.
+        This is the main entry point for parallel execution. Results are
+        grouped slide by slide as each slide's last request finishes, so
+        slide_callback can start work on ready slides while slower ones
+        are still running.
 
         Args:
             all_requests: Dict of requests grouped by API type:
@@ -65,9 +200,11 @@ class APIDispatcher:
                     "diagram": [req1, req2, ...]
                 }
             progress_callback: Optional callback(message, current, total)
+            slide_callback: Optional callback(slide_id, slide_results), called
+                once per slide as soon as all of its requests have finished
 
         Returns:
-            Dict with results grouped by slide_id:
+            Dict with results grouped by slide_id (in request order):
             {
                 "slide_000": {
                     "text": GeneratedText or None,
@@ -78,22 +215,25 @@ class APIDispatcher:
                 ...
             }
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+
+        # Per-request completions can number in the hundreds; coalesce them
+        if progress_callback:
+            progress_callback = _ThrottledCallback(progress_callback)
 
-        # Flatten all requests into a single list with metadata
+        # Flatten all requests into parallel per-request columns
         tasks = []
-        task_metadata = []
+        api_types: List[str] = []
+        slide_ids: List[Any] = []
+        slide_numbers: List[Any] = []
 
-        for api_type, requests in all_requests.items():
-            for req in requests:
+        for api_type, api_requests in all_requests.items():
+            for req in api_requests:
                 # Create coroutine for this request
-                task = self._dispatch_single(api_type, req, progress_callback)
-                tasks.append(task)
-                task_metadata.append({
-                    "api_type": api_type,
-                    "slide_id": req.get("slide_id"),
-                    "slide_number": req.get("slide_number")
-                })
+                tasks.append(self._dispatch_single(api_type, req))
+                api_types.append(api_type)
+                slide_ids.append(req.get("slide_id"))
+                slide_numbers.append(req.get("slide_number"))
 
         total_tasks = len(tasks)
         logger.info(f"Dispatching {total_tasks} API requests in parallel")
@@ -101,13 +241,53 @@ class APIDispatcher:
         if progress_callback:
             progress_callback(f"Starting {total_tasks} parallel API calls", 0, total_tasks)
 
-        # Execute all tasks in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Group results by slide_id
-        grouped_results = self._group_results_by_slide(results, task_metadata)
-
-        elapsed_time = time.time() - start_time
+        # Request indices per slide, and how many of each are still running
+        slide_indices: Dict[str, List[int]] = {}
+        for i, slide_id in enumerate(slide_ids):
+            slide_indices.setdefault(slide_id, []).append(i)
+        remaining = {slide_id: len(indices) for slide_id, indices in slide_indices.items()}
+
+        # Execute all tasks in parallel (bounded in _dispatch_single).
+        # Progress is reported per request as each one finishes, and a slide
+        # is grouped (in request order) as soon as its last request finishes.
+        results: List[Any] = [None] * total_tasks
+        slide_results: Dict[str, Dict[str, Any]] = {}
+        completed = 0
+
+        async def run_tracked(i, task):
+            nonlocal completed
+            results[i] = await task
+            completed += 1
+            if progress_callback:
+                progress_callback(
+                    f"Finished {api_types[i]} API for slide {slide_numbers[i]}",
+                    completed,
+                    total_tasks
+                )
+
+            slide_id = slide_ids[i]
+            remaining[slide_id] -= 1
+            if remaining[slide_id] == 0:
+                indices = slide_indices[slide_id]
+                grouped = self._group_results_by_slide(
+                    [results[j] for j in indices],
+                    [api_types[j] for j in indices],
+                    [slide_ids[j] for j in indices]
+                )
+                slide_results[slide_id] = grouped[slide_id]
+                if slide_callback:
+                    slide_callback(slide_id, slide_results[slide_id])
+
+        # _dispatch_single turns API errors into failed results, so only a
+        # catastrophic failure (or cancellation) aborts the group
+        async with asyncio.TaskGroup() as tg:
+            for i, task in enumerate(tasks):
+                tg.create_task(run_tracked(i, task))
+
+        # Slides in request order
+        grouped_results = {slide_id: slide_results[slide_id] for slide_id in slide_indices}
+
+        elapsed_time = time.monotonic() - start_time
         logger.info(f"All {total_tasks} API calls completed in {elapsed_time:.2f}s")
 
         if progress_callback:
@@ -118,45 +298,39 @@ class APIDispatcher:
     async def _dispatch_single(
         self,
         api_type: str,
-        request: Dict[str, Any],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        request: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Dispatch a single API request with error handling.
 
+        Progress is reported by the callers as requests finish.
+
         Args:
             api_type: Type of API ("text", "chart", "image", "diagram")
             request: Request dict
-            progress_callback: Optional progress callback
 
         Returns:
             Result dict with metadata
         """
+        slide_id = request.get("slide_id")
         slide_number = request.get("slide_number", "?")
-        logger.info(f"Dispatching {api_type} API for slide {slide_number}")
-
-        if progress_callback:
-            progress_callback(f"Calling {api_type} API for slide {slide_number}", 0, 1)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Dispatching {api_type} API for slide {slide_number}")
 
         try:
             # Route to appropriate API client
-            if api_type == "text":
-                result = await self.text_client.generate(request)
-            elif api_type == "chart":
-                result = await self.chart_client.generate(request)
-            elif api_type == "image":
-                result = await self.image_client.generate(request)
-            elif api_type == "diagram":
-                result = await self.diagram_client.generate(request)
-            else:
+            client = self._clients.get(api_type)
+            if client is None:
                 raise ValueError(f"Unknown API type: {api_type}")
 
+            result = await self._call_with_retry(client, api_type, request)
+
             logger.info(f"Successfully generated {api_type} for slide {slide_number}")
 
             return {
                 "success": True,
                 "api_type": api_type,
-                "slide_id": request.get("slide_id"),
+                "slide_id": slide_id,
                 "slide_number": slide_number,
                 "result": result,
                 "error": None
@@ -168,75 +342,95 @@ class APIDispatcher:
             return {
                 "success": False,
                 "api_type": api_type,
-                "slide_id": request.get("slide_id"),
+                "slide_id": slide_id,
                 "slide_number": slide_number,
                 "result": None,
                 "error": str(e)
             }
 
+    async def _call_with_retry(self, client, api_type: str, request: Dict[str, Any]) -> Any:
+        """
+        Call client.generate, retrying transient failures with backoff.
+
+        Concurrency slots are held per attempt only, never while backing off.
+
+        Args:
+            client: API client for api_type
+            api_type: Type of API (selects the concurrency cap)
+            request: Request dict
+
+        Returns:
+            Client result
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                async with self._api_semaphores[api_type], self._semaphore:
+                    return await client.generate(request)
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts or not _is_transient(e):
+                    raise
+                delay = self.retry_backoff * (2 ** attempt) + random.uniform(0, self.retry_backoff * 0.4)
+                logger.warning(
+                    f"Transient {api_type} API error for slide {request.get('slide_number', '?')} "
+                    f"(attempt {attempt + 1}/{self.max_attempts}), retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
     def _group_results_by_slide(
         self,
         results: List[Any],
-        metadata: List[Dict[str, Any]]
+        api_types: List[str],
+        slide_ids: List[Any]
     ) -> Dict[str, Any]:
         """
         Group API results by slide_id.
 
         Args:
-            results: List of results from asyncio.gather()
-            metadata: List of metadata for each result
+            results: List of results from the dispatch tasks
+            api_types: API type of each result
+            slide_ids: Slide ID of each result
 
         Returns:
             Dict with results grouped by slide_id
         """
         grouped = {}
 
-        for result, meta in zip(results, metadata):
-            slide_id = meta["slide_id"]
-            api_type = meta["api_type"]
-
+        for result, api_type, slide_id in zip(results, api_types, slide_ids):
             # Initialize slide entry if needed
-            if slide_id not in grouped:
-                grouped[slide_id] = {
-                    "text": None,
-                    "charts": [],
-                    "images": [],
-                    "diagrams": [],
-                    "errors": []
-                }
+            entry = grouped.get(slide_id)
+            if entry is None:
+                entry = grouped[slide_id] = _new_slide_entry()
 
-            # Handle exceptions from asyncio.gather
+            # Handle exceptions raised by a dispatch task
             if isinstance(result, Exception):
                 logger.error(f"Exception for slide {slide_id}, {api_type}: {result}")
-                grouped[slide_id]["errors"].append({
+                entry["errors"].append({
                     "api_type": api_type,
                     "error": str(result)
                 })
                 continue
 
             # Handle failed API calls
-            if not result.get("success"):
-                grouped[slide_id]["errors"].append({
+            if not result["success"]:
+                entry["errors"].append({
                     "api_type": api_type,
-                    "error": result.get("error")
+                    "error": result["error"]
                 })
                 continue
 
             # Add successful result to appropriate field
             if api_type == "text":
-                grouped[slide_id]["text"] = result["result"]
-            elif api_type == "chart":
-                grouped[slide_id]["charts"].append(result["result"])
-            elif api_type == "image":
-                grouped[slide_id]["images"].append(result["result"])
-            elif api_type == "diagram":
-                grouped[slide_id]["diagrams"].append(result["result"])
+                entry["text"] = result["result"]
+            else:
+                field = _APPEND_FIELD.get(api_type)
+                if field is not None:
+                    entry[field].append(result["result"])
 
         return grouped
 
     async def dispatch_batch(
         self,
-        requests: List[Dict[str, Any]],
+        api_requests: List[Dict[str, Any]],
         api_type: str,
         progress_callback: Optional[Callable[[str, int, int], None]] = None
     ) -> List[Dict[str, Any]]:
@@ -246,17 +440,26 @@ class APIDispatcher:
         Useful for batch processing when all requests are for the same API.
 
         Args:
-            requests: List of request dicts
+            api_requests: List of request dicts
             api_type: Type of API
             progress_callback: Optional progress callback
 
         Returns:
             List of results
         """
-        tasks = [
-            self._dispatch_single(api_type, req, progress_callback)
-            for req in requests
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return results
+        total = len(api_requests)
+        completed = 0
+        if progress_callback:
+            progress_callback = _ThrottledCallback(progress_callback)
+
+        async def run_tracked(req):
+            nonlocal completed
+            result = await self._dispatch_single(api_type, req)
+            completed += 1
+            if progress_callback:
+                progress_callback(f"Finished {api_type} API for slide {req.get('slide_number', '?')}", completed, total)
+            return result
+
+        async with asyncio.TaskGroup() as tg:
+            handles = [tg.create_task(run_tracked(req)) for req in api_requests]
+        return [handle.result() for handle in handles]
@@ -11,11 +11,42 @@ Performance: <1ms per request
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from utils.guidance_parser import parse_guidance
 
 logger = logging.getLogger(__name__)
 
+# Default request payload pieces; copied into each request so consumers can't
+# alter the defaults through a request or result
+_DEFAULT_CHART_DIMS = {"width": 800, "height": 400}
+_DEFAULT_IMAGE_DIMS = {"width": 1600, "height": 900, "aspect_ratio": "16:9"}
+_TEXT_CONSTRAINTS_TEMPLATE = {"style": "professional", "tone": "data-driven"}
+
+# Text fields whose character limit bounds generated text, in preference order
+_TEXT_FIELD_PRIORITY = ("body_text", "summary", "description", "content")
+
+# Style keywords → chart type, in priority order (default: bar)
+_CHART_TYPE_KEYWORDS = (
+    (("line", "trend"), "line"),
+    (("pie", "distribution"), "pie"),
+    (("scatter",), "scatter")
+)
+
+# (style keyword, content keyword) → diagram type, in priority order (default: flowchart)
+_DIAGRAM_TYPE_KEYWORDS = (
+    ("hierarchy", "org", "hierarchy"),
+    ("process", "workflow", "process"),
+    ("network", "connection", "network")
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse_guidance(guidance: str) -> Mapping[str, str]:
+    """Parse a guidance string once; decks reuse the same guidance across slides."""
+    return MappingProxyType(parse_guidance(guidance))
+
 
 class RequestBuilder:
     """
@@ -59,25 +90,25 @@ class RequestBuilder:
         }
 
         # Build text requests from key_points
-        if hasattr(slide, 'key_points') and slide.key_points:
+        if getattr(slide, 'key_points', None):
             text_req = self.build_text_request(slide, layout_assignment, presentation_context)
             if text_req:
                 requests["text"].append(text_req)
 
         # Build chart requests from analytics_needed
-        if hasattr(slide, 'analytics_needed') and slide.analytics_needed:
+        if getattr(slide, 'analytics_needed', None):
             chart_req = self.build_chart_request(slide, layout_assignment, presentation_context)
             if chart_req:
                 requests["chart"].append(chart_req)
 
         # Build image requests from visuals_needed
-        if hasattr(slide, 'visuals_needed') and slide.visuals_needed:
+        if getattr(slide, 'visuals_needed', None):
             image_req = self.build_image_request(slide, layout_assignment, presentation_context)
             if image_req:
                 requests["image"].append(image_req)
 
         # Build diagram requests from diagrams_needed
-        if hasattr(slide, 'diagrams_needed') and slide.diagrams_needed:
+        if getattr(slide, 'diagrams_needed', None):
             diagram_req = self.build_diagram_request(slide, layout_assignment, presentation_context)
             if diagram_req:
                 requests["diagram"].append(diagram_req)
@@ -103,34 +134,30 @@ class RequestBuilder:
         Returns:
             API request dict
         """
-        if not hasattr(slide, 'key_points') or not slide.key_points:
+        key_points = getattr(slide, 'key_points', None)
+        if not key_points:
             return None
 
         # Determine character limit from layout constraints
-        char_limit = None
-        if layout_assignment.constraints.character_limits:
-            # Get the first text field limit (body_text, summary, etc.)
-            for field in ["body_text", "summary", "description", "content"]:
-                if field in layout_assignment.constraints.character_limits:
-                    char_limit = layout_assignment.constraints.character_limits[field]
-                    break
+        # (the first text field limit: body_text, summary, etc.)
+        character_limits = layout_assignment.constraints.character_limits
+        char_limit = next(
+            (character_limits[field] for field in _TEXT_FIELD_PRIORITY if field in character_limits),
+            None
+        )
 
         return {
             "slide_id": slide.slide_id,
             "slide_number": slide.slide_number,
             "type": "text",
-            "topics": slide.key_points,
-            "narrative": slide.narrative if hasattr(slide, 'narrative') else "",
+            "topics": key_points,
+            "narrative": getattr(slide, 'narrative', ""),
             "context": {
                 "theme": presentation_context.get("overall_theme", ""),
                 "audience": presentation_context.get("target_audience", ""),
                 "slide_title": slide.title
             },
-            "constraints": {
-                "max_characters": char_limit,
-                "style": "professional",
-                "tone": "data-driven"
-            }
+            "constraints": {"max_characters": char_limit, **_TEXT_CONSTRAINTS_TEMPLATE}
         }
 
     def build_chart_request(
@@ -152,16 +179,18 @@ class RequestBuilder:
         Returns:
             Chart API request dict
         """
-        if not hasattr(slide, 'analytics_needed') or not slide.analytics_needed:
+        analytics_needed = getattr(slide, 'analytics_needed', None)
+        if not analytics_needed:
             return None
 
         # Parse guidance string
-        guidance = parse_guidance(slide.analytics_needed)
+        guidance = _cached_parse_guidance(analytics_needed)
 
         # Determine chart dimensions from layout constraints
-        dimensions = {"width": 800, "height": 400}  # Default
-        if layout_assignment.constraints.image_dimensions:
-            chart_dims = layout_assignment.constraints.image_dimensions.get("chart_url")
+        dimensions = dict(_DEFAULT_CHART_DIMS)
+        image_dimensions = layout_assignment.constraints.image_dimensions
+        if image_dimensions:
+            chart_dims = image_dimensions.get("chart_url")
             if chart_dims:
                 dimensions = {
                     "width": chart_dims.width,
@@ -170,14 +199,11 @@ class RequestBuilder:
                 }
 
         # Determine chart type from style guidance
-        chart_type = "bar"  # Default
         style = guidance.get("style", "").lower()
-        if "line" in style or "trend" in style:
-            chart_type = "line"
-        elif "pie" in style or "distribution" in style:
-            chart_type = "pie"
-        elif "scatter" in style:
-            chart_type = "scatter"
+        chart_type = next(
+            (kind for keywords, kind in _CHART_TYPE_KEYWORDS if any(k in style for k in keywords)),
+            "bar"
+        )
 
         return {
             "slide_id": slide.slide_id,
@@ -213,16 +239,18 @@ class RequestBuilder:
         Returns:
             Image API request dict
         """
-        if not hasattr(slide, 'visuals_needed') or not slide.visuals_needed:
+        visuals_needed = getattr(slide, 'visuals_needed', None)
+        if not visuals_needed:
             return None
 
         # Parse guidance string
-        guidance = parse_guidance(slide.visuals_needed)
+        guidance = _cached_parse_guidance(visuals_needed)
 
         # Determine image dimensions from layout constraints
-        dimensions = {"width": 1600, "height": 900, "aspect_ratio": "16:9"}  # Default
-        if layout_assignment.constraints.image_dimensions:
-            image_dims = layout_assignment.constraints.image_dimensions.get("image_url")
+        dimensions = dict(_DEFAULT_IMAGE_DIMS)
+        image_dimensions = layout_assignment.constraints.image_dimensions
+        if image_dimensions:
+            image_dims = image_dimensions.get("image_url")
             if image_dims:
                 dimensions = {
                     "width": image_dims.width,
@@ -264,23 +292,21 @@ class RequestBuilder:
         Returns:
             Diagram API request dict
         """
-        if not hasattr(slide, 'diagrams_needed') or not slide.diagrams_needed:
+        diagrams_needed = getattr(slide, 'diagrams_needed', None)
+        if not diagrams_needed:
             return None
 
         # Parse guidance string
-        guidance = parse_guidance(slide.diagrams_needed)
+        guidance = _cached_parse_guidance(diagrams_needed)
 
         # Determine diagram type from style/content guidance
-        diagram_type = "flowchart"  # Default
         style = guidance.get("style", "").lower()
         content = guidance.get("content", "").lower()
-
-        if "hierarchy" in style or "org" in content:
-            diagram_type = "hierarchy"
-        elif "process" in style or "workflow" in content:
-            diagram_type = "process"
-        elif "network" in style or "connection" in content:
-            diagram_type = "network"
+        diagram_type = next(
+            (kind for style_kw, content_kw, kind in _DIAGRAM_TYPE_KEYWORDS
+             if style_kw in style or content_kw in content),
+            "flowchart"
+        )
 
         return {
             "slide_id": slide.slide_id,
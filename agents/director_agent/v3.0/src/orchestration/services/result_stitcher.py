@@ -12,17 +12,36 @@ Performance: <1ms per slide
 
 import logging
 from typing import Dict, List, Any, Optional
-from orchestration.models.director_models import (
-    EnrichedSlide,
-    GeneratedText,
-    GeneratedChart,
-    GeneratedImage,
-    GeneratedDiagram
-)
+from orchestration.models.director_models import EnrichedSlide
 from orchestration.models.layout_models import LayoutAssignment, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
+# Shared status for slides stitched without a validation result (frozen model)
+_UNVALIDATED = ValidationStatus(compliant=False, violations=[])
+
+# Shared results for slides that made no API calls (read-only; the tuples
+# keep the empty collections immutable)
+EMPTY_API_RESULTS: Dict[str, Any] = {"text": None, "charts": (), "images": (), "diagrams": (), "errors": ()}
+
+
+def _first_n_sentences(text: str, n: int) -> List[str]:
+    """
+    First n non-empty ". "-separated sentences of text, stripped and with a
+    trailing period, scanning only as far as needed.
+    """
+    sentences = []
+    pos = 0
+    while len(sentences) < n:
+        end = text.find(". ", pos)
+        sentence = (text[pos:] if end < 0 else text[pos:end]).strip()
+        if sentence:
+            sentences.append(sentence + ".")
+        if end < 0:
+            break
+        pos = end + 2
+    return sentences
+
 
 class ResultStitcher:
     """
@@ -34,6 +53,13 @@ class ResultStitcher:
 
     def __init__(self):
         """Initialize result stitcher."""
+        # Layout-specific mappers; unknown layouts use _map_generic
+        self._mappers = {
+            "L01": self._map_title_slide,
+            "L05": self._map_bullet_list,
+            "L10": self._map_image_text,
+            "L17": self._map_chart_insights
+        }
         logger.info("ResultStitcher initialized (v2.0)")
 
     def stitch_slide(
@@ -41,7 +67,8 @@ class ResultStitcher:
         slide: Any,
         layout_assignment: LayoutAssignment,
         api_results: Dict[str, Any],
-        validation_status: ValidationStatus
+        validation_status: ValidationStatus,
+        mapped_content: Optional[Dict[str, Any]] = None
     ) -> EnrichedSlide:
         """
         Stitch API results into an EnrichedSlide.
@@ -58,19 +85,23 @@ class ResultStitcher:
                     "errors": [...]
                 }
             validation_status: Validation status from SLAValidator
+            mapped_content: Layout-mapped content already computed for
+                validation (mapped from api_results if omitted)
 
         Returns:
             EnrichedSlide ready for Director
         """
         # Map results to layout-specific fields
-        mapped_content = self._map_to_layout(
-            slide=slide,
-            api_results=api_results,
-            layout_id=layout_assignment.layout_id
-        )
+        if mapped_content is None:
+            mapped_content = self._map_to_layout(
+                slide=slide,
+                api_results=api_results,
+                layout_id=layout_assignment.layout_id
+            )
 
-        # Create enriched slide
-        enriched_slide = EnrichedSlide(
+        # Create enriched slide (every input is already a typed model or
+        # mapped dict, so skip re-validation)
+        enriched_slide = EnrichedSlide.model_construct(
             original_slide=slide,
             slide_id=slide.slide_id,
             layout_id=layout_assignment.layout_id,
@@ -98,17 +129,7 @@ class ResultStitcher:
             Dict with layout-specific fields
         """
         # Route to layout-specific mapper
-        if layout_id == "L01":
-            return self._map_title_slide(slide, api_results)
-        elif layout_id == "L05":
-            return self._map_bullet_list(slide, api_results)
-        elif layout_id == "L10":
-            return self._map_image_text(slide, api_results)
-        elif layout_id == "L17":
-            return self._map_chart_insights(slide, api_results)
-        else:
-            # Generic mapper
-            return self._map_generic(slide, api_results)
+        return self._mappers.get(layout_id, self._map_generic)(slide, api_results)
 
     def _map_title_slide(self, slide: Any, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -116,8 +137,7 @@ class ResultStitcher:
 
         Required: main_title, subtitle, presenter_name, organization, date
         """
-        text = results.get("text")
-        subtitle = text.content if text and isinstance(text, GeneratedText) else ""
+        subtitle = getattr(results.get("text"), "content", "")
 
         return {
             "main_title": slide.title,
@@ -136,19 +156,20 @@ class ResultStitcher:
         bullets = []
 
         # Use key_points if available
-        if hasattr(slide, 'key_points') and slide.key_points:
-            bullets = slide.key_points
+        key_points = getattr(slide, 'key_points', None)
+        if key_points:
+            bullets = key_points
 
         # If we have generated text, split into bullets
-        text = results.get("text")
-        if text and isinstance(text, GeneratedText):
-            sentences = [s.strip() for s in text.content.split(". ") if s.strip()]
+        content = getattr(results.get("text"), "content", None)
+        if content:
+            sentences = [s for s in map(str.strip, content.split(". ")) if s]
             if sentences:
                 bullets = sentences
 
         return {
             "slide_title": slide.title,
-            "subtitle": slide.narrative if hasattr(slide, 'narrative') else "",
+            "subtitle": getattr(slide, 'narrative', ""),
             "bullets": bullets
         }
 
@@ -165,15 +186,11 @@ class ResultStitcher:
         images = results.get("images", [])
         if images and len(images) > 0:
             first_image = images[0]
-            if isinstance(first_image, GeneratedImage):
-                image_url = first_image.url
-                caption = first_image.caption
+            image_url = getattr(first_image, "url", image_url)
+            caption = getattr(first_image, "caption", caption)
 
         # Get generated text
-        body_text = ""
-        text = results.get("text")
-        if text and isinstance(text, GeneratedText):
-            body_text = text.content
+        body_text = getattr(results.get("text"), "content", "")
 
         return {
             "slide_title": slide.title,
@@ -195,29 +212,25 @@ class ResultStitcher:
         charts = results.get("charts", [])
         if charts and len(charts) > 0:
             first_chart = charts[0]
-            if isinstance(first_chart, GeneratedChart):
-                chart_url = first_chart.url if first_chart.url else chart_url
-                chart_data = first_chart.data
+            chart_url = getattr(first_chart, "url", None) or chart_url
+            chart_data = getattr(first_chart, "data", chart_data)
 
-        # Generate key_insights from key_points or text
-        key_insights = []
-        if hasattr(slide, 'key_points') and slide.key_points:
-            key_insights = slide.key_points
-
-        # If we have generated text, use it for insights
-        text = results.get("text")
-        if text and isinstance(text, GeneratedText):
-            sentences = [s.strip() + "." for s in text.content.split(". ") if s.strip()]
-            key_insights = sentences[:6]  # Max 6 for L17
+        # Generate key_insights from text if we have it, else key_points
+        content = getattr(results.get("text"), "content", None)
+        if content is not None:
+            key_insights = _first_n_sentences(content, 6)  # Max 6 for L17
+        else:
+            key_insights = getattr(slide, 'key_points', None) or []
 
         # Create summary
-        summary = slide.narrative if hasattr(slide, 'narrative') else ""
-        if not summary and text:
-            summary = text.content[:200]  # First 200 chars
+        narrative = getattr(slide, 'narrative', "")
+        summary = narrative
+        if not summary and content:
+            summary = content[:200]  # First 200 chars
 
         return {
             "slide_title": slide.title,
-            "subtitle": slide.narrative if hasattr(slide, 'narrative') else "",
+            "subtitle": narrative,
             "chart_url": chart_url,
             "chart_data": chart_data,
             "key_insights": key_insights,
@@ -232,13 +245,13 @@ class ResultStitcher:
         """
         mapped = {
             "slide_title": slide.title,
-            "subtitle": slide.narrative if hasattr(slide, 'narrative') else ""
+            "subtitle": getattr(slide, 'narrative', "")
         }
 
         # Add text if generated
-        text = results.get("text")
-        if text and isinstance(text, GeneratedText):
-            mapped["body_text"] = text.content
+        content = getattr(results.get("text"), "content", None)
+        if content is not None:
+            mapped["body_text"] = content
 
         # Add first image if generated
         images = results.get("images", [])
@@ -257,8 +270,9 @@ class ResultStitcher:
             mapped["diagram_url"] = diagrams[0].url
 
         # Add key points as bullets
-        if hasattr(slide, 'key_points') and slide.key_points:
-            mapped["bullets"] = slide.key_points
+        key_points = getattr(slide, 'key_points', None)
+        if key_points:
+            mapped["bullets"] = key_points
 
         return mapped
 
@@ -284,18 +298,8 @@ class ResultStitcher:
         enriched_slides = []
 
         for slide, layout_assignment in zip(slides, layout_assignments):
-            api_results = all_api_results.get(slide.slide_id, {
-                "text": None,
-                "charts": [],
-                "images": [],
-                "diagrams": [],
-                "errors": []
-            })
-
-            validation_status = all_validation_statuses.get(
-                slide.slide_id,
-                ValidationStatus(compliant=False, violations=[])
-            )
+            api_results = all_api_results.get(slide.slide_id, EMPTY_API_RESULTS)
+            validation_status = all_validation_statuses.get(slide.slide_id, _UNVALIDATED)
 
             enriched_slide = self.stitch_slide(
                 slide=slide,
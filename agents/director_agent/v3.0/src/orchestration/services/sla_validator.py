@@ -21,6 +21,10 @@ from orchestration.models.layout_models import (
 
 logger = logging.getLogger(__name__)
 
+# Shared result for slides whose layout has nothing to check (frozen model;
+# consumers only read it)
+_COMPLIANT = ValidationStatus(compliant=True, violations=[])
+
 
 class SLAValidator:
     """
@@ -65,6 +69,19 @@ class SLAValidator:
 
         return validation_results
 
+    def is_noop(self, constraints: LayoutConstraints) -> bool:
+        """
+        Whether validating against these constraints can never find a violation.
+
+        True when there are no required fields, character limits or array
+        limits (the only constraints this validator checks).
+        """
+        return not (
+            constraints.required_fields
+            or constraints.character_limits
+            or constraints.array_limits
+        )
+
     def validate_slide(
         self,
         content: Dict[str, Any],
@@ -87,37 +104,42 @@ class SLAValidator:
         Returns:
             ValidationStatus
         """
-        violations = []
-
-        # Check required fields
-        violations.extend(self._check_required_fields(content, constraints, slide_id))
+        if self.is_noop(constraints):
+            return _COMPLIANT
 
-        # Check critical character limits (only if >2x limit)
-        violations.extend(self._check_critical_char_limits(content, constraints, slide_id))
-
-        # Check critical array limits (only if >2x limit)
-        violations.extend(self._check_critical_array_limits(content, constraints, slide_id))
+        violations = self._check_constraints(content, constraints, slide_id)
 
-        is_compliant = len([v for v in violations if v.severity == "critical"]) == 0
+        is_compliant = not any(v.severity == "critical" for v in violations)
 
-        return ValidationStatus(
+        return ValidationStatus.model_construct(
             compliant=is_compliant,
             violations=violations
         )
 
-    def _check_required_fields(
+    def _check_constraints(
         self,
         content: Dict[str, Any],
         constraints: LayoutConstraints,
         slide_id: str
     ) -> List[ValidationViolation]:
-        """Check required fields are present."""
+        """
+        Check required fields, then CRITICAL character and array limit
+        violations (>2x limit), in a single pass per constraint kind.
+
+        We assume API clients mostly return compliant content.
+        Only flag egregious violations.
+        """
+        # Violations are built from values checked here, so construct them
+        # without re-running model validation
         violations = []
+        append = violations.append
+        get = content.get
 
+        # Check required fields
         for field in constraints.required_fields:
-            if field not in content or content[field] is None:
-                violations.append(
-                    ValidationViolation(
+            if get(field) is None:
+                append(
+                    ValidationViolation.model_construct(
                         field=field,
                         constraint="required",
                         expected="present",
@@ -125,32 +147,18 @@ class SLAValidator:
                         severity="critical"
                     )
                 )
-                logger.warning(f"Slide {slide_id}: Required field '{field}' missing")
-
-        return violations
-
-    def _check_critical_char_limits(
-        self,
-        content: Dict[str, Any],
-        constraints: LayoutConstraints,
-        slide_id: str
-    ) -> List[ValidationViolation]:
-        """
-        Check only CRITICAL character limit violations (>2x limit).
-
-        We assume API clients mostly return compliant content.
-        Only flag egregious violations.
-        """
-        violations = []
+                logger.warning("Slide %s: Required field '%s' missing", slide_id, field)
 
+        # Check critical character limits (only if >2x limit)
         for field, max_length in constraints.character_limits.items():
-            if field in content and isinstance(content[field], str):
-                actual_length = len(content[field])
+            value = get(field)
+            if isinstance(value, str):
+                actual_length = len(value)
 
                 # Only flag if >2x the limit (critical violation)
                 if actual_length > max_length * 2:
-                    violations.append(
-                        ValidationViolation(
+                    append(
+                        ValidationViolation.model_construct(
                             field=field,
                             constraint="character_limit",
                             expected=f"≤{max_length}",
@@ -159,40 +167,26 @@ class SLAValidator:
                         )
                     )
                     logger.error(
-                        f"Slide {slide_id}: CRITICAL - Field '{field}' is {actual_length} chars "
-                        f"(limit: {max_length}, 2x limit: {max_length * 2})"
+                        "Slide %s: CRITICAL - Field '%s' is %d chars (limit: %d, 2x limit: %d)",
+                        slide_id, field, actual_length, max_length, max_length * 2
                     )
                 # Log warning for minor violations but don't fail
                 elif actual_length > max_length:
                     logger.warning(
-                        f"Slide {slide_id}: Field '{field}' exceeds limit: {actual_length} > {max_length} "
-                        "(not critical, <2x limit)"
+                        "Slide %s: Field '%s' exceeds limit: %d > %d (not critical, <2x limit)",
+                        slide_id, field, actual_length, max_length
                     )
 
-        return violations
-
-    def _check_critical_array_limits(
-        self,
-        content: Dict[str, Any],
-        constraints: LayoutConstraints,
-        slide_id: str
-    ) -> List[ValidationViolation]:
-        """
-        Check only CRITICAL array violations (>2x limit).
-
-        We assume API clients mostly return compliant arrays.
-        Only flag egregious violations.
-        """
-        violations = []
-
+        # Check critical array limits (only if >2x limit)
         for field, max_items in constraints.array_limits.items():
-            if field in content and isinstance(content[field], list):
-                actual_count = len(content[field])
+            value = get(field)
+            if isinstance(value, list):
+                actual_count = len(value)
 
                 # Only flag if >2x the limit
                 if actual_count > max_items * 2:
-                    violations.append(
-                        ValidationViolation(
+                    append(
+                        ValidationViolation.model_construct(
                             field=field,
                             constraint="array_limit",
                             expected=f"≤{max_items} items",
@@ -201,14 +195,14 @@ class SLAValidator:
                         )
                     )
                     logger.error(
-                        f"Slide {slide_id}: CRITICAL - Array '{field}' has {actual_count} items "
-                        f"(limit: {max_items}, 2x limit: {max_items * 2})"
+                        "Slide %s: CRITICAL - Array '%s' has %d items (limit: %d, 2x limit: %d)",
+                        slide_id, field, actual_count, max_items, max_items * 2
                     )
                 # Log warning for minor violations
                 elif actual_count > max_items:
                     logger.warning(
-                        f"Slide {slide_id}: Array '{field}' exceeds limit: {actual_count} > {max_items} "
-                        "(not critical, <2x limit)"
+                        "Slide %s: Array '%s' exceeds limit: %d > %d (not critical, <2x limit)",
+                        slide_id, field, actual_count, max_items
                     )
 
         return violations
@@ -230,7 +224,7 @@ class SLAValidator:
         Returns:
             True if all required fields present
         """
-        for field in constraints.required_fields:
-            if field not in content or content[field] is None:
-                return False
-        return True
+        required = frozenset(constraints.required_fields)
+        if not content.keys() >= required:
+            return False
+        return all(content[field] is not None for field in required)
@@ -0,0 +1,29 @@
+"""
+Shared test helpers.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+def load_module(relative_path: str) -> ModuleType:
+    """
+    Load a source module by file path.
+
+    Importing the orchestration package would pull in the whole orchestrator
+    and its dependencies, so standalone modules are loaded directly.
+
+    Args:
+        relative_path: Path under src/, e.g. "orchestration/clients/batching.py"
+
+    Returns:
+        The executed module
+    """
+    path = SRC_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,120 @@
+"""
+Unit Tests for APIDispatcher retry classification
+==================================================
+
+Checks which client errors are retried: retryable HTTP statuses and
+connection failures are, client errors (4xx) and timeouts are not, for the
+requests-based text client and the aiohttp-based chart/image/diagram clients.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import requests
+
+from conftest import load_module
+
+api_dispatcher = load_module("orchestration/services/api_dispatcher.py")
+
+APIDispatcher = api_dispatcher.APIDispatcher
+_is_transient = api_dispatcher._is_transient
+
+MAX_ATTEMPTS = 3
+
+
+def _aiohttp_status_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        SimpleNamespace(real_url="http://service.test/generate"), (), status=status
+    )
+
+
+def _requests_status_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+# Errors as each client type raises them
+STATUS_ERRORS = {
+    "text": _requests_status_error,
+    "chart": _aiohttp_status_error,
+    "image": _aiohttp_status_error,
+    "diagram": _aiohttp_status_error
+}
+TIMEOUT_ERRORS = {
+    "text": requests.Timeout,
+    "chart": asyncio.TimeoutError,
+    "image": asyncio.TimeoutError,
+    "diagram": asyncio.TimeoutError
+}
+API_TYPES = list(STATUS_ERRORS)
+
+
+class _FailingClient:
+    """Client whose generate always raises the given error."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.calls = 0
+
+    async def generate(self, request):
+        self.calls += 1
+        raise self.error
+
+
+def _dispatch(api_type: str, error: Exception) -> tuple:
+    """Dispatch one request of api_type to a failing client; return (calls, results)."""
+    client = _FailingClient(error)
+    clients = {name: _FailingClient(RuntimeError("unused")) for name in API_TYPES}
+    clients[api_type] = client
+    dispatcher = APIDispatcher(
+        text_client=clients["text"],
+        chart_client=clients["chart"],
+        image_client=clients["image"],
+        diagram_client=clients["diagram"],
+        max_attempts=MAX_ATTEMPTS,
+        retry_backoff=0
+    )
+    request = {"slide_id": "slide_001", "slide_number": 1}
+    results = asyncio.run(dispatcher.dispatch_all({api_type: [request]}))
+    return client.calls, results
+
+
+class TestTransientRetry:
+    """Retry behavior per client type."""
+
+    @pytest.mark.parametrize("api_type", API_TYPES)
+    def test_client_error_not_retried(self, api_type):
+        calls, results = _dispatch(api_type, STATUS_ERRORS[api_type](400))
+        assert calls == 1
+        assert results["slide_001"]["errors"]
+
+    @pytest.mark.parametrize("api_type", API_TYPES)
+    def test_server_error_retried(self, api_type):
+        calls, results = _dispatch(api_type, STATUS_ERRORS[api_type](503))
+        assert calls == MAX_ATTEMPTS
+        assert results["slide_001"]["errors"]
+
+    @pytest.mark.parametrize("api_type", API_TYPES)
+    def test_timeout_not_retried(self, api_type):
+        calls, _ = _dispatch(api_type, TIMEOUT_ERRORS[api_type]())
+        assert calls == 1
+
+
+class TestIsTransient:
+    """Classification of individual errors."""
+
+    def test_connection_errors_are_transient(self):
+        assert _is_transient(aiohttp.ServerDisconnectedError())
+        assert _is_transient(aiohttp.ClientConnectionError())
+        assert _is_transient(requests.ConnectionError())
+
+    def test_requests_errors_without_status_are_not_transient(self):
+        assert not _is_transient(requests.TooManyRedirects())
+        assert not _is_transient(requests.HTTPError("no response"))
+
+    def test_non_transport_errors_are_not_transient(self):
+        assert not _is_transient(RuntimeError("Chart generation failed"))
+        assert not _is_transient(ValueError("bad request"))
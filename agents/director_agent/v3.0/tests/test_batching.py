@@ -0,0 +1,60 @@
+"""
+Unit Tests for run_batch
+=========================
+
+Checks result ordering, the concurrency cap, and that a single failure
+surfaces as its own exception rather than an ExceptionGroup.
+"""
+
+import asyncio
+
+import pytest
+
+from conftest import load_module
+
+batching = load_module("orchestration/clients/batching.py")
+
+run_batch = batching.run_batch
+
+
+class TestRunBatch:
+    """Ordering, concurrency and error propagation."""
+
+    def test_results_in_request_order(self):
+        async def double(n):
+            await asyncio.sleep(0.001 * (5 - n))
+            return n * 2
+
+        assert asyncio.run(run_batch(double, [1, 2, 3, 4])) == [2, 4, 6, 8]
+
+    def test_concurrency_cap(self):
+        in_flight = 0
+        peak = 0
+
+        async def track(n):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return n
+
+        asyncio.run(run_batch(track, list(range(10)), max_concurrency=3))
+        assert peak == 3
+
+    def test_single_failure_is_unwrapped(self):
+        async def fail_on_two(n):
+            if n == 2:
+                raise RuntimeError("Chart generation failed")
+            await asyncio.sleep(0.01)
+            return n
+
+        with pytest.raises(RuntimeError, match="Chart generation failed"):
+            asyncio.run(run_batch(fail_on_two, [1, 2, 3]))
+
+    def test_multiple_failures_stay_grouped(self):
+        async def fail(n):
+            raise ValueError(str(n))
+
+        with pytest.raises(ExceptionGroup):
+            asyncio.run(run_batch(fail, [1, 2]))
@@ -0,0 +1,128 @@
+"""
+Unit Tests for CircuitBreaker
+==============================
+
+Checks which errors count against the breaker, that it opens after the
+threshold, and that the half-open state lets a single probe call through.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import requests
+
+from conftest import load_module
+
+circuit_breaker = load_module("orchestration/clients/circuit_breaker.py")
+
+CircuitBreaker = circuit_breaker.CircuitBreaker
+CircuitOpenError = circuit_breaker.CircuitOpenError
+is_service_failure = circuit_breaker.is_service_failure
+
+
+def _aiohttp_status_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        SimpleNamespace(real_url="http://service.test/generate"), (), status=status
+    )
+
+
+def _requests_status_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+def _fail(breaker: CircuitBreaker, error: Exception) -> None:
+    """Run one guarded call that raises error."""
+    with pytest.raises(type(error)):
+        with breaker.guard():
+            raise error
+
+
+class TestIsServiceFailure:
+    """Classification of errors."""
+
+    def test_timeouts_and_connection_errors_count(self):
+        assert is_service_failure(asyncio.TimeoutError())
+        assert is_service_failure(requests.Timeout())
+        assert is_service_failure(aiohttp.ServerDisconnectedError())
+        assert is_service_failure(requests.ConnectionError())
+
+    def test_server_errors_count(self):
+        assert is_service_failure(_aiohttp_status_error(503))
+        assert is_service_failure(_aiohttp_status_error(429))
+        assert is_service_failure(_requests_status_error(500))
+
+    def test_client_errors_do_not_count(self):
+        assert not is_service_failure(_aiohttp_status_error(400))
+        assert not is_service_failure(_requests_status_error(404))
+        assert not is_service_failure(RuntimeError("Chart generation failed"))
+
+
+class TestCircuitBreaker:
+    """Open, half-open and closed transitions."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=3, reset_timeout=60)
+        for _ in range(3):
+            _fail(breaker, asyncio.TimeoutError())
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            with breaker.guard():
+                pass
+
+    def test_client_errors_never_open(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=3, reset_timeout=60)
+        for _ in range(10):
+            _fail(breaker, _aiohttp_status_error(400))
+            _fail(breaker, _requests_status_error(422))
+
+        assert not breaker.is_open
+
+    def test_client_error_resets_failure_run(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=3, reset_timeout=60)
+        _fail(breaker, asyncio.TimeoutError())
+        _fail(breaker, asyncio.TimeoutError())
+        _fail(breaker, _aiohttp_status_error(400))
+        _fail(breaker, asyncio.TimeoutError())
+
+        assert not breaker.is_open
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=1, reset_timeout=0)
+        _fail(breaker, asyncio.TimeoutError())
+
+        assert breaker.before_call() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_probe_success_closes(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=1, reset_timeout=0)
+        _fail(breaker, asyncio.TimeoutError())
+
+        with breaker.guard():
+            pass
+
+        assert breaker.before_call() is False
+
+    def test_probe_failure_reopens(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=1, reset_timeout=60)
+        _fail(breaker, asyncio.TimeoutError())
+        breaker.reset_timeout = 0
+        _fail(breaker, asyncio.TimeoutError())
+
+        breaker.reset_timeout = 60
+        assert breaker.is_open
+
+    def test_cancelled_probe_frees_slot(self):
+        breaker = CircuitBreaker("Test service", failure_threshold=1, reset_timeout=0)
+        _fail(breaker, asyncio.TimeoutError())
+
+        with pytest.raises(asyncio.CancelledError):
+            with breaker.guard():
+                raise asyncio.CancelledError()
+
+        assert breaker.before_call() is True
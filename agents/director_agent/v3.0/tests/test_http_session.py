@@ -0,0 +1,42 @@
+"""
+Unit Tests for the shared aiohttp session
+==========================================
+
+Checks that the shared session is reused within a loop, and that a session
+left behind by a finished event loop is closed rather than leaked.
+"""
+
+import asyncio
+
+from conftest import load_module
+
+http_session = load_module("orchestration/clients/http_session.py")
+
+
+class TestSharedAiohttpSession:
+    """Lifecycle of the process-wide session."""
+
+    def test_reused_within_loop_and_closed_on_request(self):
+        async def main():
+            first = http_session.get_shared_aiohttp_session()
+            assert http_session.get_shared_aiohttp_session() is first
+            await http_session.close_shared_aiohttp_session()
+            return first
+
+        assert asyncio.run(main()).closed
+
+    def test_session_from_finished_loop_is_closed(self):
+        async def open_session():
+            return http_session.get_shared_aiohttp_session()
+
+        async def reopen():
+            session = http_session.get_shared_aiohttp_session()
+            await asyncio.sleep(0)
+            await http_session.close_shared_aiohttp_session()
+            return session
+
+        stale = asyncio.run(open_session())
+        fresh = asyncio.run(reopen())
+
+        assert fresh is not stale
+        assert stale.closed
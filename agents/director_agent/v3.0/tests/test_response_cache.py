@@ -0,0 +1,128 @@
+"""
+Unit Tests for ResponseCache and InflightRequests
+==================================================
+
+Checks content-addressed keys, LRU eviction and copy isolation of the
+response cache, and that concurrent duplicate requests share one call.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from conftest import load_module
+
+response_cache = load_module("orchestration/clients/response_cache.py")
+
+ResponseCache = response_cache.ResponseCache
+InflightRequests = response_cache.InflightRequests
+request_cache_key = response_cache.request_cache_key
+
+
+class _Result(BaseModel):
+    url: str
+    data: Dict[str, Any] = {}
+
+
+class TestRequestCacheKey:
+    """Content-addressed keys."""
+
+    def test_key_ignores_dict_order(self):
+        assert request_cache_key({"a": 1, "b": {"x": 1, "y": 2}}) == \
+            request_cache_key({"b": {"y": 2, "x": 1}, "a": 1})
+
+    def test_key_differs_by_content(self):
+        assert request_cache_key({"a": 1}) != request_cache_key({"a": 2})
+
+
+class TestResponseCache:
+    """LRU memo of results."""
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(2)
+        cache.put("a", _Result(url="a"))
+        cache.put("b", _Result(url="b"))
+        cache.get("a")
+        cache.put("c", _Result(url="c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").url == "a"
+        assert cache.get("c").url == "c"
+        assert len(cache) == 2
+
+    def test_entries_are_isolated_copies(self):
+        cache = ResponseCache(2)
+        original = _Result(url="a", data={"values": [1]})
+        cache.put("a", original)
+        original.data["values"].append(2)
+
+        hit = cache.get("a")
+        hit.data["values"].append(3)
+
+        assert cache.get("a").data == {"values": [1]}
+
+
+class TestInflightRequests:
+    """Sharing of concurrent duplicate requests."""
+
+    def test_concurrent_duplicates_share_one_call(self):
+        inflight = InflightRequests()
+        calls = 0
+
+        async def start():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _Result(url="shared", data={"n": 1})
+
+        async def main():
+            first, second = await asyncio.gather(
+                inflight.run("key", start),
+                inflight.run("key", start)
+            )
+            assert "key" not in inflight
+            return first, second
+
+        first, second = asyncio.run(main())
+
+        assert calls == 1
+        assert first == second
+        assert first is not second
+
+    def test_error_reaches_every_caller(self):
+        inflight = InflightRequests()
+
+        async def start():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("service failed")
+
+        async def main():
+            return await asyncio.gather(
+                inflight.run("key", start),
+                inflight.run("key", start),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        inflight = InflightRequests()
+
+        async def start():
+            await asyncio.sleep(0.02)
+            return _Result(url="done")
+
+        async def main():
+            cancelled = asyncio.ensure_future(inflight.run("key", start))
+            survivor = asyncio.ensure_future(inflight.run("key", start))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            return await survivor
+
+        assert asyncio.run(main()).url == "done"
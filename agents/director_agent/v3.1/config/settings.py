@@ -2,35 +2,44 @@
 Settings configuration for Deckster.
 """
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field
+
+# Deployed environments (APP_ENV set to anything but development) configure
+# everything through real environment variables, so skip looking for .env
+_ENV_FILE = ".env" if os.getenv("APP_ENV", "development") == "development" else None
+
+_NO_AI_KEY_MSG = (
+    "At least one AI API key must be configured. "
+    "Set GOOGLE_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY in your .env file."
+)
 
 
 class Settings(BaseSettings):
     """Application settings."""
     
     # App settings
-    APP_ENV: str = Field("development", env="APP_ENV")
-    DEBUG: bool = Field(True, env="DEBUG")
-    LOG_LEVEL: str = Field("DEBUG", env="LOG_LEVEL")
+    APP_ENV: str = "development"
+    DEBUG: bool = True
+    LOG_LEVEL: str = "DEBUG"
     
     # API settings
-    API_HOST: str = Field("0.0.0.0", env="API_HOST")
-    API_PORT: int = Field(8000, env="PORT")
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = Field(8000, validation_alias=AliasChoices("PORT", "API_PORT"))
     
     # Supabase settings
-    SUPABASE_URL: Optional[str] = Field(None, env="SUPABASE_URL")
-    SUPABASE_ANON_KEY: Optional[str] = Field(None, env="SUPABASE_ANON_KEY")
-    SUPABASE_SERVICE_KEY: Optional[str] = Field(None, env="SUPABASE_SERVICE_KEY")
+    SUPABASE_URL: str | None = None
+    SUPABASE_ANON_KEY: str | None = None
+    SUPABASE_SERVICE_KEY: str | None = None
     
     # AI services
-    GOOGLE_API_KEY: Optional[str] = Field(None, env="GOOGLE_API_KEY")
-    ANTHROPIC_API_KEY: Optional[str] = Field(None, env="ANTHROPIC_API_KEY")
-    OPENAI_API_KEY: Optional[str] = Field(None, env="OPENAI_API_KEY")
+    GOOGLE_API_KEY: str | None = None
+    ANTHROPIC_API_KEY: str | None = None
+    OPENAI_API_KEY: str | None = None
     
     # Logging
-    LOGFIRE_TOKEN: Optional[str] = Field(None, env="LOGFIRE_TOKEN")
+    LOGFIRE_TOKEN: str | None = None
     
     # Streamlined WebSocket Protocol
     USE_STREAMLINED_PROTOCOL: bool = Field(
@@ -46,45 +55,47 @@ class Settings(BaseSettings):
     )
     
     # Layout Architect Settings (Phase 2)
-    LAYOUT_ARCHITECT_MODEL: str = Field("gemini-2.5-flash-lite-preview-06-17", env="LAYOUT_ARCHITECT_MODEL")
-    LAYOUT_ARCHITECT_TEMPERATURE: float = Field(0.7, env="LAYOUT_ARCHITECT_TEMPERATURE")
-    LAYOUT_GRID_WIDTH: int = Field(160, env="LAYOUT_GRID_WIDTH")
-    LAYOUT_GRID_HEIGHT: int = Field(90, env="LAYOUT_GRID_HEIGHT")
-    LAYOUT_MARGIN: int = Field(8, env="LAYOUT_MARGIN")
-    LAYOUT_GUTTER: int = Field(4, env="LAYOUT_GUTTER")
-    LAYOUT_WHITE_SPACE_MIN: float = Field(0.3, env="LAYOUT_WHITE_SPACE_MIN")
-    LAYOUT_WHITE_SPACE_MAX: float = Field(0.5, env="LAYOUT_WHITE_SPACE_MAX")
+    LAYOUT_ARCHITECT_MODEL: str = "gemini-2.5-flash-lite-preview-06-17"
+    LAYOUT_ARCHITECT_TEMPERATURE: float = 0.7
+    LAYOUT_GRID_WIDTH: int = 160
+    LAYOUT_GRID_HEIGHT: int = 90
+    LAYOUT_MARGIN: int = 8
+    LAYOUT_GUTTER: int = 4
+    LAYOUT_WHITE_SPACE_MIN: float = 0.3
+    LAYOUT_WHITE_SPACE_MAX: float = 0.5
     
     # Three-Agent Layout Architect Configuration (Phase 2 - New Architecture)
-    THEME_AGENT_MODEL: str = Field("gemini-2.5-flash-lite-preview-06-17", env="THEME_AGENT_MODEL")
-    STRUCTURE_AGENT_MODEL: str = Field("gemini-2.5-flash-lite-preview-06-17", env="STRUCTURE_AGENT_MODEL")
-    LAYOUT_ENGINE_MODEL: str = Field("gemini-2.5-flash-lite-preview-06-17", env="LAYOUT_ENGINE_MODEL")
+    THEME_AGENT_MODEL: str = "gemini-2.5-flash-lite-preview-06-17"
+    STRUCTURE_AGENT_MODEL: str = "gemini-2.5-flash-lite-preview-06-17"
+    LAYOUT_ENGINE_MODEL: str = "gemini-2.5-flash-lite-preview-06-17"
     
     # Phase 2B Content-Driven Architecture Configuration
-    USE_PHASE_2B_ARCHITECTURE: bool = Field(True, env="USE_PHASE_2B_ARCHITECTURE")
-    CONTENT_AGENT_MODEL: str = Field("gemini-2.5-flash-lite-preview-06-17", env="CONTENT_AGENT_MODEL")
-    USE_LEGACY_WORKFLOW: bool = Field(False, env="USE_LEGACY_WORKFLOW")
+    USE_PHASE_2B_ARCHITECTURE: bool = True
+    CONTENT_AGENT_MODEL: str = "gemini-2.5-flash-lite-preview-06-17"
+    USE_LEGACY_WORKFLOW: bool = False
 
     # v2.0: Deck-Builder Integration
-    DECK_BUILDER_ENABLED: bool = Field(True, env="DECK_BUILDER_ENABLED")
-    DECK_BUILDER_API_URL: str = Field("http://localhost:8000", env="DECK_BUILDER_API_URL")
-    DECK_BUILDER_TIMEOUT: int = Field(30, env="DECK_BUILDER_TIMEOUT")
+    DECK_BUILDER_ENABLED: bool = True
+    DECK_BUILDER_API_URL: str = "http://localhost:8000"
+    DECK_BUILDER_TIMEOUT: int = 30
 
     # v3.1: Text Service Integration (Stage 6 - Content Generation)
-    TEXT_SERVICE_ENABLED: bool = Field(True, env="TEXT_SERVICE_ENABLED")
-    TEXT_SERVICE_URL: str = Field(
-        "https://web-production-e3796.up.railway.app",
-        env="TEXT_SERVICE_URL"
-    )
-    TEXT_SERVICE_TIMEOUT: int = Field(60, env="TEXT_SERVICE_TIMEOUT")
+    TEXT_SERVICE_ENABLED: bool = True
+    TEXT_SERVICE_URL: str = "https://web-production-e3796.up.railway.app"
+    TEXT_SERVICE_TIMEOUT: int = 60
+
+    # v3.0: Internal Content Orchestrator Integration
+    CONTENT_ORCHESTRATOR_ENABLED: bool = True
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"  # Ignore extra fields in .env
+    model_config = SettingsConfigDict(
+        env_file=_ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",  # Ignore extra fields in .env
+        frozen=True  # Shared process-wide via get_settings()
+    )
     
-    @property
+    @cached_property
     def has_ai_key(self) -> bool:
         """Check if at least one AI API key is configured."""
         return bool(self.GOOGLE_API_KEY or self.OPENAI_API_KEY or self.ANTHROPIC_API_KEY)
@@ -92,16 +103,28 @@ class Settings(BaseSettings):
     def validate_settings(self) -> None:
         """Validate that essential settings are configured."""
         if not self.has_ai_key:
-            raise ValueError(
-                "At least one AI API key must be configured. "
-                "Set GOOGLE_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY in your .env file."
-            )
+            raise ValueError(_NO_AI_KEY_MSG)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """
+    Get cached settings instance.
+
+    Built once per process and shared by every caller, so treat it as
+    read-only. Tests can rebuild it with get_settings.cache_clear().
+    """
     return Settings()
 
 
-# For backward compatibility with existing code
-settings = get_settings()
\ No newline at end of file
+def __getattr__(name: str):
+    """
+    Build the module-level ``settings`` on first access (PEP 562), so
+    importing this module does not read .env.
+
+    Kept for backward compatibility with ``from config.settings import settings``.
+    """
+    if name == "settings":
+        value = globals()["settings"] = get_settings()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")